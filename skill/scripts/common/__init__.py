@@ -6,6 +6,8 @@ Shared modules:
 - device_utils: ADB command building and device detection
 - screenshot_utils: Screenshot capture and processing
 - cache_utils: Progressive disclosure cache system
+- json_utils: JSON serialization with optional orjson acceleration
+- adb_session: Persistent adb shell session for repeated commands
 """
 
 from .cache_utils import ProgressiveCache, get_cache
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Persistent adb shell session.
+
+Keeps one long-lived `adb shell` process per device and runs commands by
+writing them to its stdin, instead of spawning a new adb client (and a new
+adb-server connection) for every call.
+
+Each command's output is framed by a random end marker followed by its
+exit status. stderr is merged into stdout, so a session should only be
+used for text commands. Binary transfers (exec-out, pull) should keep
+using build_adb_command.
+
+Used by:
+- push_notification.py - Notification broadcasts and channel listing
+- screen_mapper.py - Window focus lookup
+- screenshot_utils.py - screencap for callers that pass a session
+- status_bar.py - Batched status bar commands
+- test_recorder.py - Step screenshots
+"""
+
+import atexit
+import subprocess
+import threading
+import uuid
+from typing import Optional
+
+from .device_utils import build_adb_command
+
+
+class AdbSession:
+    """Runs shell commands over a single persistent `adb shell` process.
+
+    The process is started lazily on the first run() and closed on
+    close() or at interpreter exit.
+
+    Example:
+        session = AdbSession("emulator-5554")
+        result = session.run("getprop ro.build.version.sdk", check=True)
+        print(result.stdout.decode().strip())
+    """
+
+    def __init__(self, serial: Optional[str] = None):
+        """Initialize session.
+
+        Args:
+            serial: Device serial (uses default device if None)
+        """
+        self.serial = serial
+        self.proc: Optional[subprocess.Popen] = None
+        self._marker = f"__END_{uuid.uuid4().hex}__".encode()
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the adb shell process if it is not running."""
+        if self.proc is None or self.proc.poll() is not None:
+            self.proc = subprocess.Popen(
+                build_adb_command("shell", self.serial),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+        return self.proc
+
+    def run(
+        self, command: str, check: bool = False, timeout: Optional[float] = None
+    ) -> subprocess.CompletedProcess:
+        """Run a command line in the session's device shell.
+
+        The command runs in a subshell with stdin from /dev/null, so it
+        cannot consume later commands. It must be a complete shell command
+        line (balanced quotes).
+
+        Args:
+            command: Shell command line
+            check: Raise CalledProcessError on non-zero exit status
+            timeout: Seconds to wait for the command (no limit if None). On
+                expiry the session is closed; the next run() starts a new one.
+
+        Returns:
+            CompletedProcess with returncode and stdout bytes (stderr merged)
+
+        Raises:
+            subprocess.CalledProcessError: If check is True and the command
+                fails, or if the adb shell exits unexpectedly
+            subprocess.TimeoutExpired: If the command did not finish in time
+        """
+        with self._lock:
+            proc = self._ensure_started()
+            marker = self._marker
+            line = f"( {command} ) </dev/null 2>&1; echo {marker.decode()}$?\n"
+
+            chunks = []
+            returncode = None
+            expired = threading.Event()
+            timer = None
+            if timeout is not None:
+                # Killing the shell on expiry unblocks readline()
+                timer = threading.Timer(timeout, lambda: (expired.set(), proc.kill()))
+            try:
+                proc.stdin.write(line.encode())
+                proc.stdin.flush()
+                if timer is not None:
+                    timer.start()
+                for out_line in iter(proc.stdout.readline, b""):
+                    pos = out_line.find(marker)
+                    if pos == -1:
+                        chunks.append(out_line)
+                        continue
+                    # Output without a trailing newline shares the marker line
+                    chunks.append(out_line[:pos])
+                    returncode = int(out_line[pos + len(marker) :].strip() or 255)
+                    break
+            except (BrokenPipeError, ValueError):
+                pass
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+            output = b"".join(chunks)
+
+            if expired.is_set():
+                # The shell was killed mid-command; its state is unknown
+                self.close()
+                raise subprocess.TimeoutExpired(command, timeout, output=output)
+
+            if returncode is None:
+                # adb shell died (device gone, adb server restarted, ...)
+                self.close()
+                raise subprocess.CalledProcessError(255, command, output=output, stderr=output)
+
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode, command, output=output, stderr=output
+            )
+        return subprocess.CompletedProcess(command, returncode, stdout=output, stderr=b"")
+
+    def close(self) -> None:
+        """Terminate the adb shell process."""
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def __enter__(self) -> "AdbSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -287,11 +287,75 @@ def get_device_screen_size(serial: Optional[str] = None) -> tuple:
         return (1080, 1920)
 
 
+def dump_ui_xml(serial: Optional[str] = None) -> bytes:
+    """
+    Dump the current UI hierarchy as raw XML bytes.
+
+    Streams the dump over `adb exec-out uiautomator dump /dev/tty` in a
+    single round trip, with no file written on device or host. Falls back
+    to dumping to /sdcard and reading it back with `exec-out cat` on
+    devices that can't write the dump to /dev/tty.
+
+    Args:
+        serial: Device serial (uses default if None)
+
+    Returns:
+        XML document bytes (without uiautomator's trailing status line)
+
+    Raises:
+        subprocess.CalledProcessError: If an adb command fails
+        RuntimeError: If no hierarchy could be read
+
+    Example:
+        xml_bytes = dump_ui_xml("emulator-5554")
+        root = ET.fromstring(xml_bytes)
+    """
+    cmd = build_adb_command("exec-out", serial, "uiautomator", "dump", "/dev/tty")
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    xml_bytes = extract_hierarchy_xml(result.stdout)
+
+    if xml_bytes is None:
+        dump_cmd = build_adb_command("shell", serial, "uiautomator", "dump", "/sdcard/window_dump.xml")
+        subprocess.run(dump_cmd, capture_output=True, check=True)
+        cat_cmd = build_adb_command("exec-out", serial, "cat", "/sdcard/window_dump.xml")
+        result = subprocess.run(cat_cmd, capture_output=True, check=True)
+        xml_bytes = extract_hierarchy_xml(result.stdout)
+
+    if xml_bytes is None:
+        output = result.stdout.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"UI dump failed: {output or 'no hierarchy returned'}")
+
+    return xml_bytes
+
+
+def extract_hierarchy_xml(output: bytes) -> Optional[bytes]:
+    """
+    Slice the XML document out of uiautomator dump output.
+
+    Args:
+        output: Raw stdout, e.g. b"<?xml ...><hierarchy>...</hierarchy>UI hierchary dumped to: /dev/tty"
+
+    Returns:
+        XML bytes, or None if no complete hierarchy is present
+    """
+    end = output.rfind(b"</hierarchy>")
+    if end == -1:
+        return None
+
+    start = output.find(b"<?xml")
+    if start == -1:
+        start = output.find(b"<hierarchy")
+    if start == -1:
+        return None
+
+    return output[start : end + len(b"</hierarchy>")]
+
+
 def get_ui_hierarchy(serial: Optional[str] = None) -> dict:
     """
     Get UI hierarchy dump from device.
 
-    Uses uiautomator dump to get XML UI hierarchy and converts to dict.
+    Uses dump_ui_xml() to get the XML UI hierarchy and converts to dict.
 
     Args:
         serial: Device serial (uses default if None)
@@ -304,19 +368,10 @@ def get_ui_hierarchy(serial: Optional[str] = None) -> dict:
         print(f"Found {len(hierarchy)} nodes")
     """
     try:
-        # Dump UI hierarchy to device
-        dump_cmd = build_adb_command("shell", serial, "uiautomator", "dump", "/sdcard/window_dump.xml")
-        subprocess.run(dump_cmd, capture_output=True, text=True, check=True)
-
-        # Pull XML file
-        pull_cmd = build_adb_command("pull", serial, "/sdcard/window_dump.xml", "/tmp/window_dump.xml")
-        subprocess.run(pull_cmd, capture_output=True, text=True, check=True)
-
-        # Read and parse XML
+        # Stream the dump and parse it from memory (no temp file round trip)
         import xml.etree.ElementTree as ET
 
-        tree = ET.parse("/tmp/window_dump.xml")
-        root = tree.getroot()
+        root = ET.fromstring(dump_ui_xml(serial))
 
         # Convert XML to dict structure
         return _xml_to_dict(root)
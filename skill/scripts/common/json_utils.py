@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+JSON serialization helpers with optional orjson acceleration.
+
+Uses orjson (C serializer) when installed and falls back to the stdlib
+json module otherwise. Output is equivalent either way.
+
+Used by:
+- log_monitor.py - Summary and JSON output
+- navigator.py - Persistent UI tree cache
+- push_notification.py - JSON output
+- screen_mapper.py - JSON output
+- test_recorder.py - UI dumps and test report
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+# Try to import orjson for faster encoding, but make it optional
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_bytes(obj: Any, indent: bool = True) -> bytes:
+    """
+    Serialize object to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = True) -> str:
+    """
+    Serialize object to a JSON string.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as str
+    """
+    return dumps_bytes(obj, indent).decode("utf-8")
+
+
+def dump(obj: Any, path: Union[str, Path], indent: bool = True) -> None:
+    """
+    Serialize object and write it to a file.
+
+    Args:
+        obj: JSON-serializable object
+        path: Output file path
+        indent: Pretty-print with 2-space indentation
+
+    Example:
+        dump({"success": True}, "/tmp/result.json")
+    """
+    with open(path, "wb") as f:
+        f.write(dumps_bytes(obj, indent))
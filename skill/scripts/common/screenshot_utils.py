@@ -23,6 +23,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from .adb_session import AdbSession
+
 # Try to import PIL for resizing, but make it optional
 try:
     from PIL import Image
@@ -179,6 +181,18 @@ def resize_screenshot(
     return (output_path, new_w, new_h)
 
 
+def _run_silent(cmd: list) -> None:
+    """
+    Run an adb command whose output is not needed.
+
+    stdout is discarded; stderr is kept (as bytes) for error messages.
+
+    Raises:
+        subprocess.CalledProcessError: If the command fails
+    """
+    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+
+
 def capture_screenshot(
     serial: Optional[str] = None,
     output_path: Optional[str] = None,
@@ -187,6 +201,7 @@ def capture_screenshot(
     app_name: Optional[str] = None,
     screen_name: Optional[str] = None,
     state: Optional[str] = None,
+    session: Optional[AdbSession] = None,
 ) -> dict:
     """Capture screenshot from Android device/emulator with flexible output modes.
 
@@ -201,6 +216,7 @@ def capture_screenshot(
         app_name: App name for semantic naming
         screen_name: Screen name for semantic naming
         state: State description for semantic naming
+        session: Persistent adb shell to run screencap in (spawns adb if None)
 
     Returns:
         Dict with mode-specific fields:
@@ -240,14 +256,17 @@ def capture_screenshot(
         device_path = "/sdcard/screenshot.png"
         temp_path = "/tmp/android_screenshot.png"
 
-        # Build adb command
-        cmd = ["adb"]
-        if serial:
-            cmd.extend(["-s", serial])
-        cmd.extend(["shell", "screencap", "-p", device_path])
-
         # Capture screenshot on device
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        if session is not None:
+            session.run(f"screencap -p {device_path}", check=True)
+        else:
+            # Build adb command
+            cmd = ["adb"]
+            if serial:
+                cmd.extend(["-s", serial])
+            cmd.extend(["shell", "screencap", "-p", device_path])
+
+            _run_silent(cmd)
 
         # Pull screenshot from device
         pull_cmd = ["adb"]
@@ -255,7 +274,7 @@ def capture_screenshot(
             pull_cmd.extend(["-s", serial])
         pull_cmd.extend(["pull", device_path, temp_path])
 
-        subprocess.run(pull_cmd, check=True, capture_output=True, text=True)
+        _run_silent(pull_cmd)
 
         if inline:
             # Inline mode: resize and convert to base64
@@ -323,7 +342,8 @@ def capture_screenshot(
         }
 
     except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to capture screenshot: {e.stderr}") from e
+        stderr = e.stderr.decode("utf-8", "replace") if e.stderr else ""
+        raise RuntimeError(f"Failed to capture screenshot: {stderr}") from e
     except Exception as e:
         raise RuntimeError(f"Screenshot capture error: {e!s}") from e
 
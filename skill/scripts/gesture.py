@@ -28,6 +28,9 @@ Usage Examples:
     # Custom swipe path
     python scripts/gesture.py --swipe-path 100,500,900,500 --duration 300
 
+    # Swipe up on several devices concurrently
+    python scripts/gesture.py --swipe up --serials emulator-5554,emulator-5556
+
 Output Format:
     Swiped: up (540,1600) → (540,400) [300ms]
     Scrolled: down (3 swipes)
@@ -35,6 +38,7 @@ Output Format:
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import subprocess
 import sys
@@ -54,6 +58,8 @@ class GestureSimulator:
         """Initialize gesture simulator."""
         self.serial = serial
         self._screen_size = None
+        # Serial is fixed for the simulator's lifetime, so build the prefix once
+        self._shell_prefix = tuple(build_adb_command("shell", serial))
 
     def get_screen_size(self) -> tuple:
         """Get or cache screen size."""
@@ -61,6 +67,29 @@ class GestureSimulator:
             self._screen_size = get_device_screen_size(self.serial)
         return self._screen_size
 
+    def _input_swipe_cmd(self, x1: int, y1: int, x2: int, y2: int, duration_ms: int) -> tuple:
+        """Build the `input swipe` argv shared by swipes, long presses and drags."""
+        return ("input", "swipe", str(x1), str(y1), str(x2), str(y2), str(duration_ms))
+
+    def _exec_input(self, input_cmd: tuple, success_message: str, error_prefix: str) -> tuple:
+        """
+        Run an `input` command on the device.
+
+        Args:
+            input_cmd: Arguments following `adb shell`
+            success_message: Message returned on success
+            error_prefix: Prefix for the failure message
+
+        Returns:
+            (success, message) tuple
+        """
+        try:
+            cmd = self._shell_prefix + input_cmd
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            return True, success_message
+        except subprocess.CalledProcessError as e:
+            return False, f"{error_prefix}: {e.stderr}"
+
     def swipe(
         self,
         direction: str,
@@ -131,22 +160,11 @@ class GestureSimulator:
         Returns:
             (success, message) tuple
         """
-        try:
-            cmd = build_adb_command(
-                "shell",
-                self.serial,
-                "input",
-                "swipe",
-                str(x1),
-                str(y1),
-                str(x2),
-                str(y2),
-                str(duration_ms),
-            )
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return True, f"Swiped: ({x1},{y1}) → ({x2},{y2}) [{duration_ms}ms]"
-        except subprocess.CalledProcessError as e:
-            return False, f"Swipe failed: {e.stderr}"
+        return self._exec_input(
+            self._input_swipe_cmd(x1, y1, x2, y2, duration_ms),
+            f"Swiped: ({x1},{y1}) → ({x2},{y2}) [{duration_ms}ms]",
+            "Swipe failed",
+        )
 
     def scroll(
         self,
@@ -195,22 +213,11 @@ class GestureSimulator:
             (success, message) tuple
         """
         # Long press is a swipe from point to same point with duration
-        try:
-            cmd = build_adb_command(
-                "shell",
-                self.serial,
-                "input",
-                "swipe",
-                str(x),
-                str(y),
-                str(x),
-                str(y),
-                str(duration_ms),
-            )
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return True, f"Long pressed: ({x}, {y}) for {duration_ms}ms"
-        except subprocess.CalledProcessError as e:
-            return False, f"Long press failed: {e.stderr}"
+        return self._exec_input(
+            self._input_swipe_cmd(x, y, x, y, duration_ms),
+            f"Long pressed: ({x}, {y}) for {duration_ms}ms",
+            "Long press failed",
+        )
 
     def pinch(
         self,
@@ -256,6 +263,42 @@ class GestureSimulator:
         return self.swipe_path(start_x, start_y, end_x, end_y, duration_ms)
 
 
+def run_gesture(simulator: GestureSimulator, args: argparse.Namespace) -> tuple:
+    """
+    Execute the gesture selected by CLI arguments.
+
+    Args:
+        simulator: Gesture simulator bound to the target device
+        args: Parsed command-line arguments
+
+    Returns:
+        (success, message) tuple
+    """
+    if args.swipe:
+        return simulator.swipe(args.swipe, args.from_edge, args.duration)
+    if args.scroll:
+        return simulator.scroll(args.scroll, args.count, args.duration)
+    if args.long_press:
+        try:
+            x, y = map(int, args.long_press.split(","))
+        except ValueError:
+            return False, "Error: --long-press requires format 'x,y'"
+        return simulator.long_press(x, y, args.duration)
+    if args.swipe_path:
+        try:
+            x1, y1, x2, y2 = map(int, args.swipe_path.split(","))
+        except ValueError:
+            return False, "Error: --swipe-path requires format 'x1,y1,x2,y2'"
+        return simulator.swipe_path(x1, y1, x2, y2, args.duration)
+    if args.drag:
+        try:
+            x1, y1, x2, y2 = map(int, args.drag.split(","))
+        except ValueError:
+            return False, "Error: --drag requires format 'x1,y1,x2,y2'"
+        return simulator.drag_and_drop(x1, y1, x2, y2, args.duration)
+    return False, "No gesture specified"
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Android touch gesture simulator",
@@ -279,10 +322,16 @@ Examples:
 
   # Drag and drop
   python gesture.py --drag 100,500,900,500 --duration 1000
+
+  # Same swipe on several devices at once
+  python gesture.py --swipe up --serials emulator-5554,emulator-5556
         """,
     )
 
     parser.add_argument("--serial", "-s", help="Device serial number (auto-detects if omitted)")
+    parser.add_argument(
+        "--serials", help="Run the gesture on several devices concurrently (comma-separated serials)"
+    )
     parser.add_argument("--swipe", choices=["up", "down", "left", "right"], help="Directional swipe")
     parser.add_argument("--from-edge", action="store_true", help="Start swipe from screen edge")
     parser.add_argument("--scroll", choices=["up", "down"], help="Scroll direction")
@@ -295,51 +344,55 @@ Examples:
 
     args = parser.parse_args()
 
-    # Resolve device
+    if not (args.swipe or args.scroll or args.long_press or args.swipe_path or args.drag):
+        parser.print_help()
+        sys.exit(1)
+
+    # Resolve device(s)
     try:
-        serial = resolve_device_identifier(args.serial)
+        if args.serials:
+            serials = [resolve_device_identifier(s.strip()) for s in args.serials.split(",") if s.strip()]
+        else:
+            serials = [resolve_device_identifier(args.serial)]
     except RuntimeError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    simulator = GestureSimulator(serial)
+    if len(serials) == 1:
+        success, message = run_gesture(GestureSimulator(serials[0]), args)
 
-    # Execute gesture
-    success = False
-    message = ""
+        if args.json:
+            import json
 
-    if args.swipe:
-        success, message = simulator.swipe(args.swipe, args.from_edge, args.duration)
-    elif args.scroll:
-        success, message = simulator.scroll(args.scroll, args.count, args.duration)
-    elif args.long_press:
-        try:
-            x, y = map(int, args.long_press.split(","))
-            success, message = simulator.long_press(x, y, args.duration)
-        except ValueError:
-            message = "Error: --long-press requires format 'x,y'"
-    elif args.swipe_path:
-        try:
-            x1, y1, x2, y2 = map(int, args.swipe_path.split(","))
-            success, message = simulator.swipe_path(x1, y1, x2, y2, args.duration)
-        except ValueError:
-            message = "Error: --swipe-path requires format 'x1,y1,x2,y2'"
-    elif args.drag:
-        try:
-            x1, y1, x2, y2 = map(int, args.drag.split(","))
-            success, message = simulator.drag_and_drop(x1, y1, x2, y2, args.duration)
-        except ValueError:
-            message = "Error: --drag requires format 'x1,y1,x2,y2'"
-    else:
-        parser.print_help()
-        sys.exit(1)
+            print(json.dumps({"success": success, "message": message}, indent=2))
+        else:
+            print(message)
+
+        sys.exit(0 if success else 1)
+
+    # Fan out across devices; adb calls are IO-bound so threads overlap them
+    def run_one(serial: str) -> tuple:
+        return run_gesture(GestureSimulator(serial), args)
+
+    with ThreadPoolExecutor(max_workers=min(len(serials), 32)) as executor:
+        results = list(executor.map(run_one, serials))
+
+    success = all(ok for ok, _ in results)
 
     if args.json:
         import json
 
-        print(json.dumps({"success": success, "message": message}, indent=2))
+        output = {
+            "success": success,
+            "results": [
+                {"serial": serial, "success": ok, "message": msg}
+                for serial, (ok, msg) in zip(serials, results)
+            ],
+        }
+        print(json.dumps(output, indent=2))
     else:
-        print(message)
+        for serial, (_, msg) in zip(serials, results):
+            print(f"[{serial}] {msg}")
 
     sys.exit(0 if success else 1)
 
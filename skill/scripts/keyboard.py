@@ -5,7 +5,7 @@ Android Keyboard Simulator
 Text input and hardware button control for Android devices/emulators.
 
 Key Features:
-- Type text (with proper escaping)
+- Type text (with proper escaping, or one ADBKeyBoard broadcast with --adb-keyboard)
 - Special keys (enter, delete, tab, space)
 - Hardware buttons (home, back, recent apps)
 - Key combinations
@@ -35,19 +35,27 @@ Output Format:
 """
 
 import argparse
-from typing import Optional
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final, Optional
 import subprocess
 import sys
 
 from common.device_utils import build_adb_command, resolve_device_identifier
 
+# ADBKeyBoard IME (https://github.com/senzhk/ADBKeyBoard) accepts text via broadcast
+ADB_KEYBOARD_IME = "com.android.adbkeyboard/.AdbIME"
+
+# Checks (0.1 s apart) for the IME switch to land before broadcasting
+IME_SWITCH_POLLS = 20
+
 
 class KeyboardSimulator:
     """Simulates keyboard input and hardware buttons on Android."""
 
     # Android keycodes
     # https://developer.android.com/reference/android/view/KeyEvent
-    KEY_CODES = {
+    KEY_CODES: Final[dict] = {
         "enter": "KEYCODE_ENTER",
         "return": "KEYCODE_ENTER",
         "delete": "KEYCODE_DEL",
@@ -70,14 +78,80 @@ class KeyboardSimulator:
         "camera": "KEYCODE_CAMERA",
     }
 
-    def __init__(self, serial: Optional[str] = None):
-        """Initialize keyboard simulator."""
+    # Precomputed once so the unknown-key error path doesn't re-sort per call
+    _AVAILABLE_KEYS_STR: Final[str] = ", ".join(sorted(KEY_CODES))
+
+    def __init__(self, serial: Optional[str] = None, use_adb_keyboard: bool = False):
+        """
+        Initialize keyboard simulator.
+
+        Args:
+            serial: Device serial number
+            use_adb_keyboard: Type text through the ADBKeyBoard IME instead of `input text`
+        """
         self.serial = serial
+        self.use_adb_keyboard = use_adb_keyboard
+        # Serial is fixed for the simulator's lifetime, so build the prefix once
+        self._shell_prefix = tuple(build_adb_command("shell", serial))
+
+    def _type_with_adb_keyboard(self, text: str) -> Optional[tuple]:
+        """
+        Type text with one ADBKeyBoard broadcast, restoring the previous IME afterwards.
+
+        Args:
+            text: Text to type
+
+        Returns:
+            (success, message) tuple, or None if ADBKeyBoard could not be selected
+        """
+        ime = ADB_KEYBOARD_IME
+        result = subprocess.run(
+            self._shell_prefix + ("settings", "get", "secure", "default_input_method"),
+            capture_output=True,
+            text=True,
+        )
+        previous = result.stdout.strip()
+        if result.returncode != 0 or previous in ("", "null"):
+            error = result.stderr.strip() or "no default input method set"
+            return False, f"Could not read current IME: {error}"
+
+        # Switch, then wait on the device until the IME change has taken effect
+        switch_script = (
+            f"ime enable {ime} >/dev/null && ime set {ime} >/dev/null && "
+            f"for i in $(seq {IME_SWITCH_POLLS}); do "
+            f'[ "$(settings get secure default_input_method)" = {ime} ] && exit 0; '
+            "sleep 0.1; done; exit 1"
+        )
+        try:
+            result = subprocess.run(
+                self._shell_prefix + (switch_script,), capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                return None
+
+            encoded = base64.b64encode(text.encode("utf-8")).decode("ascii")
+            cmd = self._shell_prefix + (
+                "am", "broadcast", "-a", "ADB_INPUT_B64", "--es", "msg", encoded
+            )
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0 or "Broadcast completed: result=" not in result.stdout:
+                error = result.stderr.strip() or result.stdout.strip()
+                return False, f"Type failed: {error}"
+        finally:
+            if previous != ime:
+                subprocess.run(self._shell_prefix + ("ime", "set", previous), capture_output=True)
+
+        return True, f'Typed: "{text}"'
 
     def type_text(self, text: str) -> tuple:
         """
         Type text at current cursor position.
 
+        Uses `input text` by default. With use_adb_keyboard, sends a single
+        ADBKeyBoard broadcast instead, which handles any length and needs no
+        shell escaping; the user's IME is restored afterwards. Falls back to
+        `input text` if ADBKeyBoard isn't installed.
+
         Args:
             text: Text to type
 
@@ -85,6 +159,11 @@ class KeyboardSimulator:
             (success, message) tuple
         """
         try:
+            if self.use_adb_keyboard:
+                result = self._type_with_adb_keyboard(text)
+                if result is not None:
+                    return result
+
             # Escape special characters for shell
             # Space must be %s, quotes and other special chars need escaping
             escaped_text = (
@@ -96,7 +175,7 @@ class KeyboardSimulator:
                 .replace("`", "\\`")
             )
 
-            cmd = build_adb_command("shell", self.serial, "input", "text", escaped_text)
+            cmd = self._shell_prefix + ("input", "text", escaped_text)
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             return True, f'Typed: "{text}"'
         except subprocess.CalledProcessError as e:
@@ -112,15 +191,12 @@ class KeyboardSimulator:
         Returns:
             (success, message) tuple
         """
-        key_lower = key.lower()
-        if key_lower not in self.KEY_CODES:
-            available = ", ".join(sorted(self.KEY_CODES.keys()))
-            return False, f"Unknown key: {key}. Available: {available}"
-
-        keycode = self.KEY_CODES[key_lower]
+        keycode = self.KEY_CODES.get(key.lower())
+        if keycode is None:
+            return False, f"Unknown key: {key}. Available: {self._AVAILABLE_KEYS_STR}"
 
         try:
-            cmd = build_adb_command("shell", self.serial, "input", "keyevent", keycode)
+            cmd = self._shell_prefix + ("input", "keyevent", keycode)
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             return True, f"Pressed: {keycode}"
         except subprocess.CalledProcessError as e:
@@ -165,8 +241,11 @@ class KeyboardSimulator:
         """
         try:
             # Toggle IME visibility - show
-            cmd = build_adb_command(
-                "shell", self.serial, "am", "broadcast", "-a", "android.intent.action.INPUT_METHOD_CHANGED"
+            cmd = self._shell_prefix + (
+                "am",
+                "broadcast",
+                "-a",
+                "android.intent.action.INPUT_METHOD_CHANGED",
             )
             subprocess.run(cmd, capture_output=True, text=True, check=True)
             return True, "Keyboard shown"
@@ -182,7 +261,7 @@ class KeyboardSimulator:
         """
         try:
             # Press back to hide keyboard
-            cmd = build_adb_command("shell", self.serial, "input", "keyevent", "KEYCODE_BACK")
+            cmd = self._shell_prefix + ("input", "keyevent", "KEYCODE_BACK")
             subprocess.run(cmd, capture_output=True, text=True, check=True)
             return True, "Keyboard hidden"
         except subprocess.CalledProcessError as e:
@@ -206,6 +285,35 @@ class KeyboardSimulator:
         return True, f"Pressed keys: {', '.join(keys)}"
 
 
+def run_keyboard_action(keyboard: KeyboardSimulator, args: argparse.Namespace) -> tuple:
+    """
+    Execute the keyboard action selected by CLI arguments.
+
+    Args:
+        keyboard: Keyboard simulator bound to the target device
+        args: Parsed command-line arguments
+
+    Returns:
+        (success, message) tuple
+    """
+    if args.type:
+        return keyboard.type_text(args.type)
+    if args.key:
+        return keyboard.press_key(args.key)
+    if args.button:
+        return keyboard.press_button(args.button)
+    if args.keys:
+        keys = [k.strip() for k in args.keys.split(",")]
+        return keyboard.key_combination(keys)
+    if args.clear is not None:
+        return keyboard.clear_text(args.clear)
+    if args.show_keyboard:
+        return keyboard.show_keyboard()
+    if args.hide_keyboard:
+        return keyboard.hide_keyboard()
+    return False, "No action specified"
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Android keyboard and button simulator",
@@ -215,6 +323,9 @@ Examples:
   # Type text
   python keyboard.py --type "Hello World"
 
+  # Type long or non-ASCII text through ADBKeyBoard
+  python keyboard.py --type "Grüße" --adb-keyboard
+
   # Press special key
   python keyboard.py --key enter
   python keyboard.py --key delete
@@ -233,6 +344,9 @@ Examples:
   # Key combination
   python keyboard.py --keys enter,back
 
+  # Same key on several devices at once
+  python keyboard.py --key enter --serials emulator-5554,emulator-5556
+
 Available Keys:
   Text: enter/return, delete/backspace, tab, space, escape/esc
   Navigation: up, down, left, right
@@ -242,7 +356,15 @@ Available Keys:
     )
 
     parser.add_argument("--serial", "-s", help="Device serial number (auto-detects if omitted)")
+    parser.add_argument(
+        "--serials", help="Run the action on several devices concurrently (comma-separated serials)"
+    )
     parser.add_argument("--type", help="Type text")
+    parser.add_argument(
+        "--adb-keyboard",
+        action="store_true",
+        help="Type via the ADBKeyBoard IME (must be installed); the current IME is restored",
+    )
     parser.add_argument("--key", help="Press special key")
     parser.add_argument("--button", help="Press hardware button")
     parser.add_argument("--keys", help="Press multiple keys (comma-separated)")
@@ -253,44 +375,63 @@ Available Keys:
 
     args = parser.parse_args()
 
-    # Resolve device
+    if not (
+        args.type
+        or args.key
+        or args.button
+        or args.keys
+        or args.clear is not None
+        or args.show_keyboard
+        or args.hide_keyboard
+    ):
+        parser.print_help()
+        sys.exit(1)
+
+    # Resolve device(s)
     try:
-        serial = resolve_device_identifier(args.serial)
+        if args.serials:
+            serials = [resolve_device_identifier(s.strip()) for s in args.serials.split(",") if s.strip()]
+        else:
+            serials = [resolve_device_identifier(args.serial)]
     except RuntimeError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    keyboard = KeyboardSimulator(serial)
+    if len(serials) == 1:
+        success, message = run_keyboard_action(KeyboardSimulator(serials[0], args.adb_keyboard), args)
 
-    # Execute action
-    success = False
-    message = ""
+        if args.json:
+            import json
 
-    if args.type:
-        success, message = keyboard.type_text(args.type)
-    elif args.key:
-        success, message = keyboard.press_key(args.key)
-    elif args.button:
-        success, message = keyboard.press_button(args.button)
-    elif args.keys:
-        keys = [k.strip() for k in args.keys.split(",")]
-        success, message = keyboard.key_combination(keys)
-    elif args.clear is not None:
-        success, message = keyboard.clear_text(args.clear)
-    elif args.show_keyboard:
-        success, message = keyboard.show_keyboard()
-    elif args.hide_keyboard:
-        success, message = keyboard.hide_keyboard()
-    else:
-        parser.print_help()
-        sys.exit(1)
+            print(json.dumps({"success": success, "message": message}, indent=2))
+        else:
+            print(message)
+
+        sys.exit(0 if success else 1)
+
+    # Fan out across devices; adb calls are IO-bound so threads overlap them
+    def run_one(serial: str) -> tuple:
+        return run_keyboard_action(KeyboardSimulator(serial, args.adb_keyboard), args)
+
+    with ThreadPoolExecutor(max_workers=min(len(serials), 32)) as executor:
+        results = list(executor.map(run_one, serials))
+
+    success = all(ok for ok, _ in results)
 
     if args.json:
         import json
 
-        print(json.dumps({"success": success, "message": message}, indent=2))
+        output = {
+            "success": success,
+            "results": [
+                {"serial": serial, "success": ok, "message": msg}
+                for serial, (ok, msg) in zip(serials, results)
+            ],
+        }
+        print(json.dumps(output, indent=2))
     else:
-        print(message)
+        for serial, (_, msg) in zip(serials, results):
+            print(f"[{serial}] {msg}")
 
     sys.exit(0 if success else 1)
 
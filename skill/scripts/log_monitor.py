@@ -23,6 +23,9 @@ Usage Examples:
     # Extract errors and warnings only
     python scripts/log_monitor.py --severity error,warning --duration 1m
 
+    # Snapshot of the last 500 lines
+    python scripts/log_monitor.py --app com.myapp --tail 500
+
     # Save logs to file
     python scripts/log_monitor.py --app com.myapp --duration 1m --output logs/
 
@@ -31,17 +34,113 @@ Usage Examples:
 """
 
 import argparse
-import json
+from collections import deque
+from itertools import islice
+import os
+import queue
 import re
 import signal
 import subprocess
 import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+# Try to import google-re2 for the fallback line regex, but make it optional
+try:
+    import re2
+
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+from common import json_utils
 from common.device_utils import build_adb_command, get_device_serial
 
+# Default cap on buffered log lines
+DEFAULT_MAX_LINES = 100_000
+
+# Default line count for snapshot (no --follow/--duration) captures
+DEFAULT_TAIL_LINES = 1000
+
+# Dedup table size at which it is reset
+DEDUP_MAX_ENTRIES = 100_000
+
+# First API level whose logcat accepts --uid (Android 9)
+LOGCAT_UID_MIN_SDK = 28
+
+# Drops digits so messages differing only in numbers deduplicate together
+_DIGIT_TRANS = str.maketrans("", "", "0123456789")
+
+# Duration strings like "30s", "5m", "1h"
+_DUR_RE = re.compile(r"(\d+)([smh])")
+_DUR_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+# Logcat "-v threadtime" line: date time PID TID Priority Tag: Message
+# (compiled with RE2's DFA engine when google-re2 is installed)
+_LOGCAT_RE = (re2 if HAS_RE2 else re).compile(
+    r"(\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3})\s+(\d+)\s+(\d+)\s+([VDIWEF])\s+([^:]+):\s*(.*)"
+)
+
+
+def _split_threadtime(line: str) -> Optional[tuple]:
+    """
+    Split a logcat threadtime line without the regex engine.
+
+    Args:
+        line: Logcat line, e.g. "12-11 18:30:45.123  1234  5678 E Tag: Message"
+
+    Returns:
+        (timestamp, pid, tid, priority, tag, message) tuple, or None if the
+        line doesn't have the expected fixed-width shape
+    """
+    if len(line) < 19 or line[2] != "-" or line[5] != " " or line[14] != "." or line[18] != " ":
+        return None
+
+    parts = line[19:].split(None, 3)
+    if len(parts) != 4:
+        return None
+
+    pid, tid, priority, rest = parts
+    if not (pid.isdigit() and tid.isdigit()) or len(priority) != 1 or priority not in "VDIWEF":
+        return None
+
+    colon = rest.find(":")
+    if colon <= 0:
+        return None
+
+    return line[:18], pid, tid, priority, rest[:colon], rest[colon + 1 :]
+
+
+def _pump_chunks(fd: int, chunks: queue.SimpleQueue):
+    """
+    Read a pipe in large chunks and queue them until EOF.
+
+    Args:
+        fd: File descriptor to read from
+        chunks: Queue receiving byte chunks; an empty chunk marks EOF
+    """
+    while True:
+        try:
+            chunk = os.read(fd, 65536)
+        except OSError:
+            chunk = b""
+        chunks.put(chunk)
+        if not chunk:
+            return
+
+
+def _format_entries(entries: deque, count: int) -> list:
+    """Format the first `count` (tag, message) entries as "[tag] message"."""
+    return [f"[{tag}] {message}" for tag, message in islice(entries, count)]
+
+
+def _tail(lines: deque, count: int) -> list:
+    """Return the last `count` items of a deque, oldest first."""
+    return list(islice(reversed(lines), count))[::-1]
+
 
 class LogMonitor:
     """Monitor and analyze Android device/emulator logs with intelligent filtering."""
@@ -56,11 +155,35 @@ class LogMonitor:
         "F": "fatal",
     }
 
+    # Logcat priority letter -> severity bucket (fatal counts as error)
+    _SEV_OF_PRIO = {
+        "E": "error",
+        "F": "error",
+        "W": "warning",
+        "I": "info",
+        "D": "debug",
+        "V": "verbose",
+    }
+
+    # Severity -> lowest logcat priority letter that satisfies it
+    _SEV_FLOOR = {
+        "verbose": "V",
+        "debug": "D",
+        "info": "I",
+        "warning": "W",
+        "error": "E",
+        "fatal": "E",
+    }
+
+    # Logcat priority ordering (V < D < I < W < E < F)
+    _PRIO_RANK = {"V": 0, "D": 1, "I": 2, "W": 3, "E": 4, "F": 5}
+
     def __init__(
         self,
         app_package: Optional[str] = None,
         device_serial: Optional[str] = None,
         severity_filter: Optional[list] = None,
+        max_lines: int = DEFAULT_MAX_LINES,
     ):
         """
         Initialize log monitor.
@@ -69,32 +192,71 @@ class LogMonitor:
             app_package: Filter logs by app package name
             device_serial: Device serial (auto-detects if None)
             severity_filter: List of severities to include (error, warning, info, debug, verbose)
+            max_lines: Maximum log lines kept in memory (oldest are dropped)
         """
         self.app_package = app_package
         self.device_serial = device_serial
-        self.severity_filter = severity_filter or ["error", "warning", "info", "debug"]
+        self.severity_filter = frozenset(severity_filter or ["error", "warning", "info", "debug"])
+        self.max_lines = max_lines
+
+        # Log storage (bounded ring buffers so follow mode stays flat in memory);
+        # errors/warnings/info hold (tag, message) tuples, formatted on output
+        self.log_lines = deque(maxlen=max_lines)
+        self.errors = deque(maxlen=max_lines)
+        self.warnings = deque(maxlen=max_lines)
+        self.info_messages = deque(maxlen=20)  # Keep only recent info
+
+        # Statistics (accepted lines per logcat priority letter)
+        self._counts = dict.fromkeys(self._SEV_OF_PRIO, 0)
+        self.total_lines = 0
 
-        # Log storage
-        self.log_lines = []
-        self.errors = []
-        self.warnings = []
-        self.info_messages = []
+        # Per-priority dispatch tables for the per-line hot path
+        self._accept = {p: sev in self.severity_filter for p, sev in self._SEV_OF_PRIO.items()}
+        self._bucket = {
+            "E": self.errors,
+            "F": self.errors,
+            "W": self.warnings,
+            "I": self.info_messages,
+        }
 
-        # Statistics
-        self.error_count = 0
-        self.warning_count = 0
-        self.info_count = 0
-        self.debug_count = 0
-        self.verbose_count = 0
-        self.total_lines = 0
+        # Deduplication (hashes of digit-masked tag/message pairs)
+        self.seen_hashes = set()
 
-        # Deduplication
-        self.seen_messages = set()
+        # Raw log file written during streaming (if any)
+        self.log_file_path: Optional[Path] = None
 
         # Process control
         self.log_process = None
         self.interrupted = False
 
+        # Device API level, read lazily and only once
+        self._sdk_level: Optional[int] = None
+
+    @property
+    def error_count(self) -> int:
+        """Number of accepted error and fatal lines."""
+        return self._counts["E"] + self._counts["F"]
+
+    @property
+    def warning_count(self) -> int:
+        """Number of accepted warning lines."""
+        return self._counts["W"]
+
+    @property
+    def info_count(self) -> int:
+        """Number of accepted info lines."""
+        return self._counts["I"]
+
+    @property
+    def debug_count(self) -> int:
+        """Number of accepted debug lines."""
+        return self._counts["D"]
+
+    @property
+    def verbose_count(self) -> int:
+        """Number of accepted verbose lines."""
+        return self._counts["V"]
+
     def parse_time_duration(self, duration_str: str) -> float:
         """
         Parse duration string to seconds.
@@ -105,23 +267,21 @@ class LogMonitor:
         Returns:
             Duration in seconds
         """
-        match = re.match(r"(\d+)([smh])", duration_str.lower())
+        duration_str = duration_str.lower()
+
+        # Fast path for the common "<digits><unit>" form
+        unit = duration_str[-1:]
+        if unit in _DUR_UNITS and duration_str[:-1].isdigit():
+            return int(duration_str[:-1]) * _DUR_UNITS[unit]
+
+        match = _DUR_RE.match(duration_str)
         if not match:
             raise ValueError(
                 f"Invalid duration format: {duration_str}. Use format like '30s', '5m', '1h'"
             )
 
         value, unit = match.groups()
-        value = int(value)
-
-        if unit == "s":
-            return value
-        if unit == "m":
-            return value * 60
-        if unit == "h":
-            return value * 3600
-
-        return 0
+        return int(value) * _DUR_UNITS[unit]
 
     def parse_logcat_line(self, line: str) -> Optional[dict]:
         """
@@ -136,14 +296,15 @@ class LogMonitor:
         Returns:
             Dict with parsed fields or None if invalid
         """
-        # Match logcat format
-        pattern = r"(\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3})\s+(\d+)\s+(\d+)\s+([VDIWEF])\s+([^:]+):\s*(.*)"
-        match = re.match(pattern, line)
+        fields = _split_threadtime(line)
+        if fields is None:
+            # Unusual spacing: fall back to the regex
+            match = _LOGCAT_RE.match(line)
+            if not match:
+                return None
+            fields = match.groups()
 
-        if not match:
-            return None
-
-        timestamp, pid, tid, priority, tag, message = match.groups()
+        timestamp, pid, tid, priority, tag, message = fields
 
         return {
             "timestamp": timestamp,
@@ -166,18 +327,7 @@ class LogMonitor:
         Returns:
             Severity level (error, warning, info, debug, verbose)
         """
-        priority = parsed.get("priority", "I")
-
-        if priority in ["E", "F"]:
-            return "error"
-        elif priority == "W":
-            return "warning"
-        elif priority == "I":
-            return "info"
-        elif priority == "D":
-            return "debug"
-        else:  # V
-            return "verbose"
+        return self._SEV_OF_PRIO.get(parsed.get("priority", "I"), "verbose")
 
     def deduplicate_message(self, message: str, tag: str) -> bool:
         """
@@ -190,79 +340,121 @@ class LogMonitor:
         Returns:
             True if this is a new message, False if duplicate
         """
-        # Create signature from tag and message (without timestamps/PIDs)
-        signature = f"{tag}:{message}"
-        signature = re.sub(r"\d+", "", signature)  # Remove numbers
-        signature = re.sub(r"\s+", " ", signature).strip()
+        # Fingerprint tag and message without digits (timestamps/PIDs/counters)
+        fingerprint = hash((tag.translate(_DIGIT_TRANS), message.translate(_DIGIT_TRANS)))
 
-        if signature in self.seen_messages:
+        if fingerprint in self.seen_hashes:
             return False
 
-        self.seen_messages.add(signature)
+        # Bound memory under sustained error storms
+        if len(self.seen_hashes) >= DEDUP_MAX_ENTRIES:
+            self.seen_hashes.clear()
+
+        self.seen_hashes.add(fingerprint)
         return True
 
-    def process_log_line(self, line: str):
+    def process_log_line(self, line: str) -> Optional[tuple]:
         """
         Process a single log line.
 
         Args:
             line: Log line to process
+
+        Returns:
+            (raw_line, severity) tuple, or None if the line isn't in logcat format
         """
-        if not line.strip():
-            return
+        if not line or line.isspace():
+            return None
+
+        # "--------- beginning of main" buffer banners never match the regex
+        if line.startswith("---------"):
+            parsed = None
+        else:
+            parsed = self.parse_logcat_line(line)
 
-        # Parse logcat format
-        parsed = self.parse_logcat_line(line)
         if not parsed:
             # Store unparsed line as-is
             self.log_lines.append(line)
             self.total_lines += 1
-            return
+            return None
 
         self.total_lines += 1
         self.log_lines.append(parsed["raw"])
 
-        # Classify severity
-        severity = self.classify_log_line(parsed)
+        priority = parsed["priority"]
+        severity = self._SEV_OF_PRIO[priority]
 
         # Skip if not in filter
-        if severity not in self.severity_filter:
-            return
+        if not self._accept[priority]:
+            return line, severity
 
         # Deduplicate (for errors and warnings)
-        if severity in ["error", "warning"]:
-            if not self.deduplicate_message(parsed["message"], parsed["tag"]):
-                return
-
-        # Store by severity
-        if severity == "error":
-            self.error_count += 1
-            self.errors.append(f"[{parsed['tag']}] {parsed['message']}")
-        elif severity == "warning":
-            self.warning_count += 1
-            self.warnings.append(f"[{parsed['tag']}] {parsed['message']}")
-        elif severity == "info":
-            self.info_count += 1
-            if len(self.info_messages) < 20:  # Keep only recent info
-                self.info_messages.append(f"[{parsed['tag']}] {parsed['message']}")
-        elif severity == "debug":
-            self.debug_count += 1
-        else:  # verbose
-            self.verbose_count += 1
+        if priority in "EFW" and not self.deduplicate_message(parsed["message"], parsed["tag"]):
+            return line, severity
+
+        # Count and store by priority
+        self._counts[priority] += 1
+        bucket = self._bucket.get(priority)
+        if bucket is not None:
+            bucket.append((parsed["tag"], parsed["message"]))
+
+        return line, severity
+
+    def _get_process_uid(self, pid: str) -> Optional[str]:
+        """
+        Look up the numeric UID of a device process.
+
+        Args:
+            pid: Process ID on the device
+
+        Returns:
+            UID string, or None if it couldn't be determined
+        """
+        uid_cmd = build_adb_command("shell", self.device_serial, "ps", "-o", "UID=", "-p", pid)
+        try:
+            result = subprocess.run(uid_cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError:
+            return None
+
+        uid = result.stdout.strip()
+        return uid if uid.isdigit() else None
+
+    def _get_sdk_level(self) -> int:
+        """
+        Read the device API level, caching it for later calls.
+
+        Returns:
+            SDK level, or 0 if it couldn't be determined
+        """
+        if self._sdk_level is None:
+            sdk_cmd = build_adb_command(
+                "shell", self.device_serial, "getprop", "ro.build.version.sdk"
+            )
+            result = subprocess.run(sdk_cmd, capture_output=True, text=True)
+            sdk = result.stdout.strip()
+            self._sdk_level = int(sdk) if sdk.isdigit() else 0
+        return self._sdk_level
 
     def stream_logs(
         self,
         follow: bool = False,
         duration: Optional[float] = None,
         clear_first: bool = False,
+        output_dir: Optional[str] = None,
+        tail_lines: int = DEFAULT_TAIL_LINES,
     ) -> bool:
         """
         Stream logs from device/emulator.
 
+        Without follow or duration, takes a one-shot snapshot of the most
+        recent `tail_lines` lines and exits.
+
         Args:
             follow: Follow mode (continuous streaming)
             duration: Capture duration in seconds
             clear_first: Clear logcat buffer before streaming
+            output_dir: Directory to write the raw log to as it arrives
+            tail_lines: Number of recent lines for a snapshot
 
         Returns:
             True if successful
@@ -278,9 +470,15 @@ class LogMonitor:
         # Build logcat command
         cmd = build_adb_command("logcat", self.device_serial)
 
-        # Add format (time format with full timestamps)
+        # Add format (threadtime: date time PID TID Priority Tag: Message)
         cmd.append("-v")
-        cmd.append("time")
+        cmd.append("threadtime")
+
+        # Snapshot: dump the most recent lines and exit instead of streaming
+        if not follow and not duration:
+            cmd.append("-d")
+            cmd.append("-T")
+            cmd.append(str(tail_lines))
 
         # Add app package filter if specified
         if self.app_package:
@@ -290,38 +488,29 @@ class LogMonitor:
             )
             try:
                 result = subprocess.run(pid_cmd, capture_output=True, text=True, check=True)
-                pid = result.stdout.strip()
-                if pid:
-                    cmd.append(f"--pid={pid}")
+                pids = result.stdout.split()
+                if len(pids) == 1:
+                    cmd.append(f"--pid={pids[0]}")
+                elif pids:
+                    # Multi-process app: logcat takes a single --pid, so filter
+                    # by the app's UID (shared by all its processes) instead.
+                    # Older logcat rejects --uid, so fall back to the first PID.
+                    uid = None
+                    if self._get_sdk_level() >= LOGCAT_UID_MIN_SDK:
+                        uid = self._get_process_uid(pids[0])
+                    cmd.append(f"--uid={uid}" if uid else f"--pid={pids[0]}")
             except subprocess.CalledProcessError:
                 # App might not be running, continue without PID filter
                 pass
 
-        # Add severity filters
+        # Add severity filter as a logcat priority floor so lines below the
+        # lowest requested severity are dropped on the device side
         if self.severity_filter:
-            # Build priority filter string
-            # logcat uses single letters: V D I W E F
-            priority_letters = []
-            for sev in self.severity_filter:
-                if sev == "error":
-                    priority_letters.extend(["E", "F"])
-                elif sev == "warning":
-                    priority_letters.append("W")
-                elif sev == "info":
-                    priority_letters.append("I")
-                elif sev == "debug":
-                    priority_letters.append("D")
-                elif sev == "verbose":
-                    priority_letters.append("V")
-
-            # Use the minimum priority level (shows that level and above)
-            # V < D < I < W < E < F
-            priority_order = ["V", "D", "I", "W", "E", "F"]
-            if priority_letters:
-                min_priority = priority_order[
-                    min(priority_order.index(p) for p in priority_letters)
-                ]
-                cmd.append("*:{}".format(min_priority))
+            floors = [self._SEV_FLOOR[s] for s in self.severity_filter if s in self._SEV_FLOOR]
+            if floors:
+                min_priority = min(floors, key=self._PRIO_RANK.__getitem__)
+                cmd.append("-s")
+                cmd.append(f"*:{min_priority}")
 
         # Setup signal handler for graceful interruption
         def signal_handler(sig, frame):
@@ -331,44 +520,89 @@ class LogMonitor:
 
         signal.signal(signal.SIGINT, signal_handler)
 
+        log_file = None
         try:
-            # Start log streaming process
+            # Write raw lines straight to disk as they arrive
+            if output_dir:
+                self.log_file_path = self._new_log_path(output_dir)
+                log_file = open(self.log_file_path, "wb", buffering=1024 * 1024)
+
+            # Start log streaming process (binary; lines are split and decoded here)
             self.log_process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,  # Line buffered
             )
 
-            # Track start time for duration
-            start_time = datetime.now()
-
-            # Process log lines
-            for line in iter(self.log_process.stdout.readline, ""):
-                if not line:
-                    break
-
-                # Process the line
-                self.process_log_line(line.rstrip())
-
-                # Print in follow mode
-                if follow:
-                    parsed = self.parse_logcat_line(line.rstrip())
-                    if parsed:
-                        severity = self.classify_log_line(parsed)
-                        if severity in self.severity_filter:
-                            print(line.rstrip())
-
-                # Check duration
-                if duration and (datetime.now() - start_time).total_seconds() >= duration:
-                    break
-
-                # Check if interrupted
-                if self.interrupted:
-                    break
-
-            # Wait for process to finish
+            # Reader thread only drains the pipe so logcat never blocks on a
+            # full pipe while lines are being parsed here
+            chunks = queue.SimpleQueue()
+            reader = threading.Thread(
+                target=_pump_chunks,
+                args=(self.log_process.stdout.fileno(), chunks),
+                daemon=True,
+            )
+            reader.start()
+
+            # Deadline for duration (monotonic clock, checked once per chunk)
+            deadline = time.monotonic() + duration if duration else None
+
+            # Local aliases for the per-line hot loop
+            process = self.process_log_line
+            sev_filter = self.severity_filter
+            write = sys.stdout.write
+
+            # Split chunks into lines ourselves, keeping any trailing partial
+            # line for the next chunk
+            buf = bytearray()
+            while not self.interrupted:
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+
+                try:
+                    chunk = chunks.get(timeout=timeout)
+                except queue.Empty:
+                    break  # Duration elapsed with no more output
+
+                if not chunk:
+                    break  # logcat exited
+
+                buf += chunk
+                lines = buf.split(b"\n")
+                buf = lines.pop()
+
+                for raw in lines:
+                    if log_file:
+                        log_file.write(raw)
+                        log_file.write(b"\n")
+
+                    # Split already dropped "\n"; some adb builds also send "\r"
+                    line = raw.decode("utf-8", "replace")
+                    if line.endswith("\r"):
+                        line = line[:-1]
+
+                    # Process the line (parsed once, reused for follow output)
+                    result = process(line)
+
+                    # Print in follow mode
+                    if follow and result and result[1] in sev_filter:
+                        write(result[0])
+                        write("\n")
+
+            if buf and not self.interrupted:
+                if log_file:
+                    log_file.write(buf)
+                    log_file.write(b"\n")
+                line = buf.decode("utf-8", "replace")
+                if line.endswith("\r"):
+                    line = line[:-1]
+                self.process_log_line(line)
+
+            # Stop logcat and reap it
+            self.log_process.terminate()
             self.log_process.wait()
             return True
 
@@ -379,6 +613,8 @@ class LogMonitor:
         finally:
             if self.log_process:
                 self.log_process.terminate()
+            if log_file:
+                log_file.close()
 
     def get_summary(self, verbose: bool = False) -> str:
         """
@@ -407,18 +643,18 @@ class LogMonitor:
         # Top issues
         if self.errors:
             lines.append(f"\nTop Errors ({len(self.errors)}):")
-            for error in self.errors[:5]:  # Show first 5
+            for error in _format_entries(self.errors, 5):  # Show first 5
                 lines.append(f"  ❌ {error[:120]}")  # Truncate long lines
 
         if self.warnings:
             lines.append(f"\nTop Warnings ({len(self.warnings)}):")
-            for warning in self.warnings[:5]:  # Show first 5
+            for warning in _format_entries(self.warnings, 5):  # Show first 5
                 lines.append(f"  ⚠️  {warning[:120]}")
 
         # Verbose output
         if verbose and self.log_lines:
             lines.append("\n=== Recent Log Lines ===")
-            for line in self.log_lines[-50:]:  # Last 50 lines
+            for line in _tail(self.log_lines, 50):  # Last 50 lines
                 lines.append(line)
 
         return "\n".join(lines)
@@ -436,38 +672,54 @@ class LogMonitor:
                 "debug": self.debug_count,
                 "verbose": self.verbose_count,
             },
-            "errors": self.errors[:20],  # Limit to 20
-            "warnings": self.warnings[:20],
-            "sample_logs": self.log_lines[-50:],  # Last 50 lines
+            "errors": _format_entries(self.errors, 20),  # Limit to 20
+            "warnings": _format_entries(self.warnings, 20),
+            "sample_logs": _tail(self.log_lines, 50),  # Last 50 lines
         }
 
-    def save_logs(self, output_dir: str) -> str:
+    def _new_log_path(self, output_dir: str) -> Path:
         """
-        Save logs to file.
+        Create output directory and generate a timestamped log file path.
 
         Args:
             output_dir: Directory to save logs
 
         Returns:
-            Path to saved log file
+            Path for the log file
         """
-        # Create output directory
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         app_name = self.app_package.split(".")[-1] if self.app_package else "device"
-        log_file = output_path / f"{app_name}-{timestamp}.log"
+        return output_path / f"{app_name}-{timestamp}.log"
 
-        # Write all log lines
-        with open(log_file, "w") as f:
-            f.write("\n".join(self.log_lines))
+    def save_logs(self, output_dir: str) -> str:
+        """
+        Save logs to file.
+
+        If stream_logs already wrote the raw log to disk, only the JSON
+        summary is written next to it.
+
+        Args:
+            output_dir: Directory to save logs
+
+        Returns:
+            Path to saved log file
+        """
+        log_file = self.log_file_path
+        if log_file is None:
+            log_file = self._new_log_path(output_dir)
+
+            # Write all buffered log lines (line by line, no joined copy)
+            with open(log_file, "w") as f:
+                for line in self.log_lines:
+                    f.write(line)
+                    f.write("\n")
 
         # Also save JSON summary
-        json_file = output_path / f"{app_name}-{timestamp}-summary.json"
-        with open(json_file, "w") as f:
-            json.dump(self.get_json_output(), f, indent=2)
+        json_file = log_file.with_name(f"{log_file.stem}-summary.json")
+        json_utils.dump(self.get_json_output(), json_file)
 
         return str(log_file)
 
@@ -513,10 +765,22 @@ Examples:
         "--follow", action="store_true", help="Follow mode (continuous streaming)"
     )
     time_group.add_argument("--duration", help="Capture duration (e.g., 30s, 5m, 1h)")
+    parser.add_argument(
+        "--tail",
+        type=int,
+        default=DEFAULT_TAIL_LINES,
+        help=f"Lines to dump without --follow/--duration (default: {DEFAULT_TAIL_LINES})",
+    )
 
     # Output options
     parser.add_argument("--output", help="Save logs to directory")
     parser.add_argument("--verbose", action="store_true", help="Show detailed output")
+    parser.add_argument(
+        "--max-buffer",
+        type=int,
+        default=DEFAULT_MAX_LINES,
+        help=f"Maximum log lines kept in memory (default: {DEFAULT_MAX_LINES})",
+    )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument(
         "--clear", action="store_true", help="Clear logcat buffer before streaming"
@@ -534,6 +798,7 @@ Examples:
         app_package=args.app_package,
         device_serial=args.device_serial,
         severity_filter=severity_filter,
+        max_lines=args.max_buffer,
     )
 
     # Parse duration
@@ -547,7 +812,11 @@ Examples:
         print(f"App: {args.app_package}", file=sys.stderr)
 
     success = monitor.stream_logs(
-        follow=args.follow, duration=duration, clear_first=args.clear
+        follow=args.follow,
+        duration=duration,
+        clear_first=args.clear,
+        output_dir=args.output,
+        tail_lines=args.tail,
     )
 
     if not success:
@@ -561,7 +830,7 @@ Examples:
     # Output results
     if not args.follow:  # Don't show summary in follow mode
         if args.json:
-            print(json.dumps(monitor.get_json_output(), indent=2))
+            print(json_utils.dumps(monitor.get_json_output()))
         else:
             print("\n" + monitor.get_summary(verbose=args.verbose))
 
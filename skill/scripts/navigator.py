@@ -16,7 +16,7 @@ Key Features:
 - Tap elements at their center point
 - Enter text into text fields
 - List all interactive elements on screen
-- Automatic element caching for performance
+- Automatic element caching for performance (optionally across calls with --cache)
 
 Usage Examples:
     # Find and tap a button by text
@@ -46,30 +46,113 @@ Navigation Priority (best to worst):
     4. Tap at coordinates (last resort, fragile)
 
 Technical Details:
-- Uses uiautomator dump via `adb shell uiautomator dump`
-- Parses XML hierarchy with element bounds and attributes
-- Finds elements by parsing tree recursively
+- Uses uiautomator dump streamed via `adb exec-out uiautomator dump /dev/tty`
+- Parses XML hierarchy with element bounds and attributes (lxml if installed)
+- Finds elements by walking the tree lazily, stopping at the requested match
 - Calculates tap coordinates from element bounds center
 - Uses `adb shell input tap` for tapping, `adb shell input text` for text entry
 - Extracts data from text, content-desc, and resource-id attributes
 """
 
 import argparse
-from typing import Optional
+from typing import Callable, Iterator, Optional
 import json as json_lib
-import re
+import os
 import subprocess
 import sys
-import xml.etree.ElementTree as ET
+import time
+from collections import defaultdict
 from dataclasses import dataclass
-
-from common.device_utils import build_adb_command, resolve_device_identifier
+from itertools import islice
+from pathlib import Path
+
+# Prefer lxml (libxml2 C parser) for UI dumps, but make it optional
+try:
+    import lxml.etree as ET
+
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    HAS_LXML = False
+
+from common import json_utils
+from common.device_utils import build_adb_command, dump_ui_xml, resolve_device_identifier
+
+# Cross-invocation UI tree cache (opt-in, see Navigator.persistent_cache)
+TREE_CACHE_DIR = Path("~/.android-emulator-skill/cache").expanduser()
+TREE_CACHE_MAX_AGE = 10.0  # seconds
+
+# Turns "[x1,y1][x2,y2]" into whitespace-separated numbers
+_BOUNDS_TRANS = str.maketrans({"[": " ", "]": " ", ",": " "})
+
+# Escapes for `input text`: spaces become %s, shell metacharacters get a backslash
+_ADB_INPUT_TRANS = str.maketrans(
+    {
+        " ": "%s",
+        "\\": "\\\\",
+        "'": "\\'",
+        '"': '\\"',
+        "&": "\\&",
+        "(": "\\(",
+        ")": "\\)",
+        "<": "\\<",
+        ">": "\\>",
+        "|": "\\|",
+        ";": "\\;",
+        "$": "\\$",
+        "`": "\\`",
+    }
+)
+
+
+class _HierarchyStream:
+    """
+    File-like wrapper over a dump pipe that ends at the closing </hierarchy> tag.
+
+    `uiautomator dump /dev/tty` prints a status line after the XML, which
+    would make the incremental parser fail on the final chunk.
+    """
+
+    _END_TAG = b"</hierarchy>"
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._tail = b""
+        self._done = False
+
+    def read(self, size: int = -1) -> bytes:
+        if self._done:
+            return b""
+
+        # read1 returns whatever is available so parsing overlaps the dump
+        data = self._stream.read1(size if size > 0 else 65536)
+        window = self._tail + data
+        end = window.find(self._END_TAG)
+        if end != -1:
+            self._done = True
+            return data[: end + len(self._END_TAG) - len(self._tail)]
+
+        self._tail = window[-(len(self._END_TAG) - 1) :]
+        return data
 
 
 @dataclass
 class Element:
     """Represents a UI element from Android UI hierarchy."""
 
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+): no per-node __dict__
+    __slots__ = (
+        "type",
+        "text",
+        "content_desc",
+        "resource_id",
+        "bounds",
+        "clickable",
+        "enabled",
+        "search_key",
+    )
+
     type: str  # Class name (Button, EditText, TextView, etc.)
     text: Optional[str]
     content_desc: Optional[str]
@@ -77,6 +160,7 @@ class Element:
     bounds: tuple  # (x1, y1, x2, y2)
     clickable: bool
     enabled: bool
+    search_key: str  # Lowercased "text content_desc" for fuzzy matching
 
     @property
     def center(self) -> tuple:
@@ -100,10 +184,21 @@ class Element:
 class Navigator:
     """Navigates Android apps using UI hierarchy data."""
 
-    def __init__(self, serial: Optional[str] = None):
-        """Initialize navigator with optional device serial."""
+    def __init__(self, serial: Optional[str] = None, persistent_cache: bool = False):
+        """
+        Initialize navigator.
+
+        Args:
+            serial: Optional device serial
+            persistent_cache: Reuse a recent UI dump from a previous invocation
+                when the foreground activity is unchanged
+        """
         self.serial = serial
+        self.persistent_cache = persistent_cache
         self._tree_cache = None
+        self._xml_cache: Optional[bytes] = None
+        self._indexes: Optional[dict] = None
+        self._fingerprint: Optional[str] = None
 
     def get_ui_hierarchy(self, force_refresh: bool = False) -> ET.Element:
         """
@@ -119,30 +214,110 @@ class Navigator:
             return self._tree_cache
 
         try:
-            # Dump UI hierarchy to device
-            dump_cmd = build_adb_command(
-                "shell", self.serial, "uiautomator", "dump", "/sdcard/window_dump.xml"
-            )
-            result = subprocess.run(dump_cmd, capture_output=True, text=True, check=True)
+            xml_bytes = None
+            if self.persistent_cache and not force_refresh:
+                xml_bytes = self._load_tree_cache()
 
-            if "ERROR" in result.stdout or "error" in result.stderr.lower():
-                raise RuntimeError(f"UI dump failed: {result.stdout or result.stderr}")
-
-            # Pull XML file to local temp
-            temp_file = "/tmp/android_navigator_dump.xml"
-            pull_cmd = build_adb_command("pull", self.serial, "/sdcard/window_dump.xml", temp_file)
-            subprocess.run(pull_cmd, capture_output=True, text=True, check=True)
+            if xml_bytes is None:
+                # Stream the dump straight from the device (no temp files)
+                xml_bytes = dump_ui_xml(self.serial)
+                if self.persistent_cache:
+                    self._save_tree_cache(xml_bytes)
 
             # Parse XML
-            tree = ET.parse(temp_file)
-            self._tree_cache = tree.getroot()
+            if HAS_LXML:
+                root = ET.fromstring(xml_bytes, ET.XMLParser(remove_blank_text=True))
+            else:
+                root = ET.fromstring(xml_bytes)
+
+            self._xml_cache = xml_bytes
+            self._tree_cache = root
+            self._indexes = None
             return self._tree_cache
 
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to get UI hierarchy: {e.stderr}") from e
+            stderr = e.stderr.decode("utf-8", "replace") if e.stderr else ""
+            raise RuntimeError(f"Failed to get UI hierarchy: {stderr}") from e
         except ET.ParseError as e:
             raise RuntimeError(f"Failed to parse UI hierarchy XML: {e}") from e
 
+    def _tree_cache_path(self) -> Path:
+        """Get the persistent tree cache file for this device."""
+        return TREE_CACHE_DIR / f"ui-tree-{self.serial or 'default'}.json"
+
+    def _screen_fingerprint(self) -> Optional[str]:
+        """
+        Get a cheap fingerprint of the current screen (foreground activity).
+
+        Returns:
+            Fingerprint string, or None if it could not be determined
+        """
+        if self._fingerprint is None:
+            cmd = build_adb_command("shell", self.serial, "dumpsys activity top | grep ACTIVITY")
+            try:
+                result = subprocess.run(cmd, capture_output=True, check=True)
+            except subprocess.CalledProcessError:
+                return None
+            self._fingerprint = result.stdout.strip().decode("utf-8", "replace") or None
+        return self._fingerprint
+
+    def _load_tree_cache(self) -> Optional[bytes]:
+        """
+        Load the UI dump saved by a previous invocation if it is still valid.
+
+        Returns:
+            Cached XML bytes, or None if missing, expired, or the activity changed
+        """
+        try:
+            with open(self._tree_cache_path(), encoding="utf-8") as f:
+                entry = json_lib.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("created_at", 0) > TREE_CACHE_MAX_AGE:
+            return None
+
+        fingerprint = self._screen_fingerprint()
+        if fingerprint is None or entry.get("fingerprint") != fingerprint:
+            return None
+
+        return entry["xml"].encode("utf-8")
+
+    def _save_tree_cache(self, xml_bytes: bytes) -> None:
+        """
+        Save a UI dump for reuse by later invocations.
+
+        Args:
+            xml_bytes: Raw uiautomator XML
+        """
+        fingerprint = self._screen_fingerprint()
+        if fingerprint is None:
+            return
+
+        path = self._tree_cache_path()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        entry = {
+            "fingerprint": fingerprint,
+            "created_at": time.time(),
+            "xml": xml_bytes.decode("utf-8", "replace"),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            json_utils.dump(entry, tmp_path, indent=False)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _drop_tree_cache(self) -> None:
+        """Invalidate the persistent tree cache after an action changes the screen."""
+        if self.persistent_cache:
+            try:
+                self._tree_cache_path().unlink()
+            except OSError:
+                pass
+            self._fingerprint = None
+
     def _parse_bounds(self, bounds_str: str) -> tuple:
         """
         Parse bounds string to coordinates.
@@ -153,26 +328,23 @@ class Navigator:
         Returns:
             Tuple of (x1, y1, x2, y2)
         """
-        # Format: [x1,y1][x2,y2]
-        match = re.match(r"\[(\d+),(\d+)\]\[(\d+),(\d+)\]", bounds_str)
-        if match:
-            return tuple(int(x) for x in match.groups())
-        return (0, 0, 0, 0)
+        # Format: [x1,y1][x2,y2] -> "x1 y1 x2 y2"
+        try:
+            x1, y1, x2, y2 = bounds_str.translate(_BOUNDS_TRANS).split()
+            return (int(x1), int(y1), int(x2), int(y2))
+        except ValueError:
+            return (0, 0, 0, 0)
 
-    def _flatten_tree(self, node: ET.Element, elements: Optional[list ] = None) -> list:
+    def _build_element(self, node: ET.Element) -> Element:
         """
-        Flatten UI hierarchy into list of elements.
+        Build an Element from a UI hierarchy node.
 
         Args:
-            node: Current XML element
-            elements: List to accumulate elements
+            node: XML node
 
         Returns:
-            List of Element objects
+            Element object
         """
-        if elements is None:
-            elements = []
-
         # Get element attributes
         elem_class = node.get("class", "")
         text = node.get("text", "")
@@ -183,28 +355,159 @@ class Navigator:
         enabled = node.get("enabled", "true") == "true"
 
         # Extract simple class name
-        simple_class = elem_class.split(".")[-1] if elem_class else "Unknown"
+        simple_class = elem_class[elem_class.rfind(".") + 1 :] if elem_class else "Unknown"
 
         # Parse bounds
         bounds = self._parse_bounds(bounds_str)
 
-        # Create element
-        element = Element(
+        return Element(
             type=simple_class,
             text=text if text else None,
             content_desc=content_desc if content_desc else None,
-            resource_id=resource_id.split("/")[-1] if resource_id else None,  # Extract ID from full path
+            resource_id=resource_id[resource_id.rfind("/") + 1 :] if resource_id else None,  # Extract ID from full path
             bounds=bounds,
             clickable=clickable,
             enabled=enabled,
+            search_key=f"{text} {content_desc}".lower(),
         )
-        elements.append(element)
 
-        # Recurse to children
-        for child in node:
-            self._flatten_tree(child, elements)
+    def _iter_elements(
+        self, root: ET.Element, predicate: Optional[Callable[[ET.Element], bool]] = None
+    ) -> Iterator[Element]:
+        """
+        Lazily yield elements of the UI hierarchy in document order.
+
+        Args:
+            root: XML root element
+            predicate: Optional check on the raw XML node; nodes that fail it
+                are skipped without building an Element
+
+        Yields:
+            Element objects
+        """
+        for node in root.iter():
+            if predicate is None or predicate(node):
+                yield self._build_element(node)
+
+    @staticmethod
+    def _is_interactive_node(node: ET.Element) -> bool:
+        """
+        Check whether a raw node is clickable, enabled and has a label.
+
+        Mirrors the Element-level check `clickable and enabled and
+        label != "Unnamed"` without building the Element.
+
+        Args:
+            node: XML node
+
+        Returns:
+            True if the node is interactive
+        """
+        if node.get("clickable", "false") != "true" or node.get("enabled", "true") != "true":
+            return False
+        resource_id = node.get("resource-id", "")
+        return bool(
+            node.get("text")
+            or node.get("content-desc")
+            or resource_id[resource_id.rfind("/") + 1 :]
+        )
+
+    def _get_indexes(self) -> dict:
+        """
+        Get lookup indexes for the cached UI tree (built once per tree).
+
+        Only raw node attributes are indexed; Element objects are built
+        lazily by _iter_matching and memoized per position.
+
+        Returns:
+            Dict with "nodes" (document order), per-position "types",
+            "resource_ids", "enabled" and "elements" lists, plus "by_type"
+            and "by_resource_id" (both mapping to node positions)
+        """
+        root = self.get_ui_hierarchy()
+        if self._indexes is None:
+            nodes = list(root.iter())
+            types = []
+            resource_ids = []
+            enabled = []
+            by_type = defaultdict(list)
+            by_resource_id = defaultdict(list)
+
+            for pos, node in enumerate(nodes):
+                elem_class = node.get("class", "")
+                simple_class = elem_class[elem_class.rfind(".") + 1 :] if elem_class else "Unknown"
+                resource_id = node.get("resource-id", "")
+                rid = resource_id[resource_id.rfind("/") + 1 :] if resource_id else None
+
+                types.append(simple_class)
+                resource_ids.append(rid)
+                enabled.append(node.get("enabled", "true") == "true")
+                by_type[simple_class].append(pos)
+                if rid:
+                    by_resource_id[rid].append(pos)
+
+            self._indexes = {
+                "nodes": nodes,
+                "types": types,
+                "resource_ids": resource_ids,
+                "enabled": enabled,
+                "elements": [None] * len(nodes),
+                "by_type": by_type,
+                "by_resource_id": by_resource_id,
+            }
+        return self._indexes
+
+    def _iter_matching(
+        self,
+        *,
+        element_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        require_enabled: bool = True,
+    ) -> Iterator[Element]:
+        """
+        Lazily yield elements that pass the type, resource ID and enabled filters.
+
+        Candidates come from the most selective index (resource ID, then
+        type) and are checked against raw node attributes, so an Element is
+        only built for nodes that pass.
+
+        Args:
+            element_type: Type of element (Button, EditText, etc.)
+            resource_id: Resource ID substring
+            require_enabled: Skip disabled elements
+
+        Yields:
+            Matching Element objects in document order
+        """
+        indexes = self._get_indexes()
+        nodes = indexes["nodes"]
+        types = indexes["types"]
+        resource_ids = indexes["resource_ids"]
+        enabled = indexes["enabled"]
+        elements = indexes["elements"]
+
+        if resource_id:
+            positions = sorted(
+                pos
+                for rid, rid_positions in indexes["by_resource_id"].items()
+                if resource_id in rid
+                for pos in rid_positions
+            )
+        elif element_type:
+            positions = indexes["by_type"].get(element_type, [])
+        else:
+            positions = range(len(nodes))
+
+        for pos in positions:
+            if require_enabled and not enabled[pos]:
+                continue
+            if element_type and types[pos] != element_type:
+                continue
 
-        return elements
+            elem = elements[pos]
+            if elem is None:
+                elem = elements[pos] = self._build_element(nodes[pos])
+            yield elem
 
     def find_element(
         self,
@@ -221,47 +524,58 @@ class Navigator:
             text: Text to search in text/content-desc
             element_type: Type of element (Button, EditText, etc.)
             resource_id: Resource ID (without package prefix)
-            index: Which matching element to return (0-based)
+            index: Which matching element to return (0-based; negative counts from the end)
             fuzzy: Use fuzzy matching for text (case-insensitive substring)
 
         Returns:
             Element if found, None otherwise
         """
-        root = self.get_ui_hierarchy()
-        elements = self._flatten_tree(root)
+        matches = self._find_gen(text, element_type, resource_id, fuzzy)
 
-        matches = []
+        if index < 0:
+            # Counting from the end needs every match
+            try:
+                return list(matches)[index]
+            except IndexError:
+                return None
 
-        for elem in elements:
-            # Skip disabled elements
-            if not elem.enabled:
-                continue
+        # Stop at the index-th match instead of walking the whole tree
+        return next(islice(matches, index, None), None)
 
-            # Check type
-            if element_type and elem.type != element_type:
-                continue
+    def _find_gen(
+        self,
+        text: Optional[str],
+        element_type: Optional[str],
+        resource_id: Optional[str],
+        fuzzy: bool,
+    ) -> Iterator[Element]:
+        """
+        Lazily yield elements matching all find criteria.
 
-            # Check resource ID (partial match)
-            if resource_id:
-                if not elem.resource_id or resource_id not in elem.resource_id:
-                    continue
+        Args:
+            text: Text to search in text/content-desc
+            element_type: Type of element (Button, EditText, etc.)
+            resource_id: Resource ID substring
+            fuzzy: Use fuzzy matching for text (case-insensitive substring)
+
+        Yields:
+            Matching Element objects in document order
+        """
+        # Casefold the query once per call, and only when fuzzy matching needs it;
+        # the element side is already lowercased in search_key
+        text_lower = text.lower() if text and fuzzy else None
 
+        for elem in self._iter_matching(element_type=element_type, resource_id=resource_id):
             # Check text (in text or content_desc)
             if text:
-                elem_text = (elem.text or "") + " " + (elem.content_desc or "")
                 if fuzzy:
-                    if text.lower() not in elem_text.lower():
+                    if text_lower not in elem.search_key:
                         continue
                 else:
                     if text not in (elem.text, elem.content_desc):
                         continue
 
-            matches.append(elem)
-
-        if matches and index < len(matches):
-            return matches[index]
-
-        return None
+            yield elem
 
     def tap(self, element: Element) -> tuple:
         """
@@ -292,10 +606,12 @@ class Navigator:
         """
         try:
             cmd = build_adb_command("shell", self.serial, "input", "tap", str(x), str(y))
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            subprocess.run(cmd, capture_output=True, check=True)
+            self._drop_tree_cache()
             return True, f"Tapped at ({x}, {y})"
         except subprocess.CalledProcessError as e:
-            return False, f"Tap failed: {e.stderr}"
+            stderr = e.stderr.decode("utf-8", "replace") if e.stderr else ""
+            return False, f"Tap failed: {stderr}"
 
     def enter_text(self, element: Element, text: str) -> tuple:
         """
@@ -308,16 +624,33 @@ class Navigator:
         Returns:
             (success, message) tuple
         """
-        # First tap the element to focus it
-        tap_success, _ = self.tap(element)
-        if not tap_success:
-            return False, f"Failed to focus {element.description}"
+        x, y = element.center
+        escaped_text = text.translate(_ADB_INPUT_TRANS)
 
-        # Enter text
-        success, message = self.type_text(text)
-        if success:
+        # Tap to focus and type in a single adb round trip
+        try:
+            self._shell_exec(f"input tap {x} {y} && input text {escaped_text}")
+            self._drop_tree_cache()
             return True, f"Entered text in: {element.description}"
-        return False, message
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode("utf-8", "replace") if e.stderr else ""
+            return False, f"Failed to enter text in {element.description}: {stderr}"
+
+    def _shell_exec(self, command: str) -> subprocess.CompletedProcess:
+        """
+        Run a composite command line in one device shell.
+
+        Args:
+            command: Shell command line (may chain commands with &&)
+
+        Returns:
+            Completed process (stdout/stderr as bytes)
+
+        Raises:
+            subprocess.CalledProcessError: If the remote command fails
+        """
+        cmd = build_adb_command("shell", self.serial, command)
+        return subprocess.run(cmd, capture_output=True, check=True)
 
     def type_text(self, text: str) -> tuple:
         """
@@ -330,14 +663,57 @@ class Navigator:
             (success, message) tuple
         """
         try:
-            # Escape spaces and special characters
-            escaped_text = text.replace(" ", "%s").replace("'", "\\'")
+            # Escape spaces and special characters in one pass
+            escaped_text = text.translate(_ADB_INPUT_TRANS)
 
             cmd = build_adb_command("shell", self.serial, "input", "text", escaped_text)
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            subprocess.run(cmd, capture_output=True, check=True)
+            self._drop_tree_cache()
             return True, f"Typed: {text}"
         except subprocess.CalledProcessError as e:
-            return False, f"Type failed: {e.stderr}"
+            stderr = e.stderr.decode("utf-8", "replace") if e.stderr else ""
+            return False, f"Type failed: {stderr}"
+
+    def watch_elements(self, interactive_only: bool = True) -> Iterator[Element]:
+        """
+        Stream elements from a fresh UI dump while it is still being read.
+
+        Parses the `exec-out uiautomator dump /dev/tty` pipe incrementally,
+        so elements are yielded before the dump finishes. The cached tree is
+        not used or updated. Breaking out of the loop stops the dump.
+
+        Args:
+            interactive_only: Only yield clickable/focusable elements
+
+        Yields:
+            Element objects in document order
+
+        Raises:
+            RuntimeError: If the dump output cannot be parsed
+        """
+        cmd = build_adb_command("exec-out", self.serial, "uiautomator", "dump", "/dev/tty")
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+        try:
+            for event, node in ET.iterparse(
+                _HierarchyStream(proc.stdout), events=("start", "end")
+            ):
+                if event == "end":
+                    # Element was built on "start"; free the subtree
+                    node.clear()
+                    continue
+
+                if interactive_only and not self._is_interactive_node(node):
+                    continue
+                yield self._build_element(node)
+
+        except ET.ParseError as e:
+            raise RuntimeError(f"Failed to parse UI hierarchy XML: {e}") from e
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.terminate()
+            proc.wait()
 
     def list_elements(self, interactive_only: bool = True) -> list:
         """
@@ -350,13 +726,10 @@ class Navigator:
             List of elements
         """
         root = self.get_ui_hierarchy(force_refresh=True)
-        elements = self._flatten_tree(root)
 
-        if interactive_only:
-            # Filter to clickable and enabled elements
-            return [e for e in elements if e.clickable and e.enabled and e.label != "Unnamed"]
-
-        return elements
+        # Filter to clickable and enabled elements on the raw nodes
+        predicate = self._is_interactive_node if interactive_only else None
+        return list(self._iter_elements(root, predicate))
 
 
 def main():
@@ -380,6 +753,12 @@ Examples:
   # List all interactive elements
   python navigator.py --list
 
+  # Reuse the UI dump from the previous call on an unchanged screen
+  python navigator.py --find-text "Settings" --cache
+
+  # Stream interactive elements as JSON lines while the dump is parsed
+  python navigator.py --list --stream --json
+
   # Tap at coordinates (fallback)
   python navigator.py --tap-at 200,400
         """,
@@ -395,7 +774,17 @@ Examples:
     parser.add_argument("--enter-text", help="Enter text into found element")
     parser.add_argument("--tap-at", help="Tap at coordinates (format: x,y)")
     parser.add_argument("--list", action="store_true", help="List all interactive elements")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="With --list, print elements as they are parsed (JSON lines with --json)",
+    )
     parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse a UI dump from a previous call (<{TREE_CACHE_MAX_AGE:g}s old, same activity)",
+    )
 
     args = parser.parse_args()
 
@@ -406,7 +795,32 @@ Examples:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    navigator = Navigator(serial)
+    navigator = Navigator(serial, persistent_cache=args.cache)
+
+    # Streaming list mode
+    if args.list and args.stream:
+        count = 0
+        try:
+            for elem in navigator.watch_elements():
+                if args.json:
+                    elem_data = {
+                        "type": elem.type,
+                        "label": elem.label,
+                        "bounds": elem.bounds,
+                        "center": elem.center,
+                    }
+                    print(json_lib.dumps(elem_data), flush=True)
+                else:
+                    x, y = elem.center
+                    print(f"  {count}. {elem.description} at ({x}, {y})", flush=True)
+                count += 1
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        if not args.json:
+            print(f"Interactive elements: {count}")
+        sys.exit(0)
 
     # List mode
     if args.list:
@@ -20,14 +20,32 @@ Usage Examples:
 """
 
 import argparse
+import functools
 import json
+import re
+import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
 from common.device_utils import build_adb_command, get_device_serial
 
+# Markers delimiting per-permission output of batched pm commands
+_BEGIN_MARKER = "__BEGIN__"
+_END_MARKER = "__END__"
+
+# dumpsys package sections: header line followed by permission (or blank) lines
+_SECTION_BODY = rb"[^\n]*\n((?:[ \t\r]*(?:android\.permission\.[^\n]*)?\n)*)"
+_GRANTED_RE = re.compile(
+    rb"^[^\n]*granted permissions:" + _SECTION_BODY, re.IGNORECASE | re.MULTILINE
+)
+_REQUESTED_RE = re.compile(
+    rb"^[^\n]*requested permissions:" + _SECTION_BODY, re.IGNORECASE | re.MULTILINE
+)
+_PERM_LINE_RE = re.compile(rb"android\.permission\.[^\n]*")
+
 
 class PrivacyManager:
     """Manages Android app permissions."""
@@ -57,6 +75,9 @@ class PrivacyManager:
         "notification": "android.permission.POST_NOTIFICATIONS",
     }
 
+    # Full permission name -> short name (for display)
+    REVERSE_PERMISSIONS = {v: k for k, v in SUPPORTED_PERMISSIONS.items()}
+
     def __init__(self, serial: Optional[str] = None):
         """
         Initialize privacy manager.
@@ -66,9 +87,11 @@ class PrivacyManager:
         """
         self.serial = serial
 
-    def get_permission_name(self, permission: str) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_permission_name(permission: str) -> Optional[str]:
         """
-        Get full permission name from short name.
+        Get full permission name from short name (memoized).
 
         Args:
             permission: Short name (e.g., "camera") or full name
@@ -81,7 +104,7 @@ class PrivacyManager:
             return permission
 
         # Look up short name
-        return self.SUPPORTED_PERMISSIONS.get(permission.lower())
+        return PrivacyManager.SUPPORTED_PERMISSIONS.get(permission.lower())
 
     def grant_permission(self, package: str, permission: str) -> tuple:
         """
@@ -104,18 +127,33 @@ class PrivacyManager:
         cmd = build_adb_command("shell", self.serial, "pm", "grant", package, full_permission)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            subprocess.run(cmd, capture_output=True, check=True)
             return True, f"Granted {permission} to {package}"
 
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            # Check common errors
-            if "not requested" in error_msg.lower():
-                return False, f"Permission {permission} not declared in app manifest"
-            elif "unknown package" in error_msg.lower():
-                return False, f"Package not found: {package}"
-            else:
-                return False, f"Failed to grant permission: {error_msg}"
+            error_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
+            return False, self._grant_error_message(package, permission, error_msg)
+
+    @staticmethod
+    def _grant_error_message(package: str, permission: str, error_msg: str) -> str:
+        """
+        Map pm grant error output to a readable message.
+
+        Args:
+            package: App package name
+            permission: Permission as given by the user
+            error_msg: Error output from pm
+
+        Returns:
+            Error message
+        """
+        # Check common errors
+        if "not requested" in error_msg.lower():
+            return f"Permission {permission} not declared in app manifest"
+        elif "unknown package" in error_msg.lower():
+            return f"Package not found: {package}"
+        else:
+            return f"Failed to grant permission: {error_msg}"
 
     def revoke_permission(self, package: str, permission: str) -> tuple:
         """
@@ -138,13 +176,131 @@ class PrivacyManager:
         cmd = build_adb_command("shell", self.serial, "pm", "revoke", package, full_permission)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            subprocess.run(cmd, capture_output=True, check=True)
             return True, f"Revoked {permission} from {package}"
 
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+            error_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
             return False, f"Failed to revoke permission: {error_msg}"
 
+    def grant_many(self, package: str, permissions: list, parallel: bool = False) -> list:
+        """
+        Grant several permissions in a single adb shell round trip.
+
+        Args:
+            package: App package name
+            permissions: Permissions to grant (short or full names)
+            parallel: Run one concurrent adb shell per permission instead
+
+        Returns:
+            List of (success, message) tuples, one per permission
+        """
+        return self._run_pm_many("grant", package, permissions, parallel)
+
+    def revoke_many(self, package: str, permissions: list, parallel: bool = False) -> list:
+        """
+        Revoke several permissions in a single adb shell round trip.
+
+        Args:
+            package: App package name
+            permissions: Permissions to revoke (short or full names)
+            parallel: Run one concurrent adb shell per permission instead
+
+        Returns:
+            List of (success, message) tuples, one per permission
+        """
+        return self._run_pm_many("revoke", package, permissions, parallel)
+
+    def _run_pm_many(
+        self, action: str, package: str, permissions: list, parallel: bool = False
+    ) -> list:
+        """
+        Run "pm grant" or "pm revoke" for several permissions in one shell.
+
+        Each pm call is wrapped in begin/end markers so its output and exit
+        status can be attributed to the right permission. With parallel=True
+        the single-permission methods run concurrently instead (up to 4
+        adb shells), which keeps each call independent.
+
+        Args:
+            action: "grant" or "revoke"
+            package: App package name
+            permissions: Permissions (short or full names)
+            parallel: Use concurrent per-permission adb shells
+
+        Returns:
+            List of (success, message) tuples, one per permission
+        """
+        if parallel and permissions:
+            run_one = self.grant_permission if action == "grant" else self.revoke_permission
+            with ThreadPoolExecutor(max_workers=min(len(permissions), 4)) as executor:
+                # map() keeps results in permission order
+                return list(executor.map(lambda p: run_one(package, p), permissions))
+
+        results = [None] * len(permissions)
+        pending = []
+        script_parts = []
+
+        for i, permission in enumerate(permissions):
+            full_permission = self.get_permission_name(permission)
+            if not full_permission:
+                results[i] = (
+                    False,
+                    f"Unknown permission: {permission}. Use --list-permissions to see available.",
+                )
+                continue
+            pending.append(i)
+            script_parts.append(
+                f"echo {_BEGIN_MARKER}; "
+                f"pm {action} {shlex.quote(package)} {shlex.quote(full_permission)} 2>&1; "
+                f"echo {_END_MARKER}$?"
+            )
+
+        if not pending:
+            return results
+
+        # adb shell joins its arguments, so the script is quoted as one word
+        script = "; ".join(script_parts)
+        cmd = build_adb_command("shell", self.serial, "sh", "-c", shlex.quote(script))
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=True)
+            blocks = result.stdout.split(_BEGIN_MARKER.encode() + b"\n")[1:]
+            missing_msg = "no result from device shell"
+        except subprocess.CalledProcessError as e:
+            blocks = []
+            missing_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
+
+        for n, i in enumerate(pending):
+            permission = permissions[i]
+            if n < len(blocks):
+                output, _, status = blocks[n].rpartition(_END_MARKER.encode())
+                success = status.strip() == b"0"
+                if not success:
+                    # Only failures need the pm output as text
+                    error_msg = output.strip().decode("utf-8", "replace") or (
+                        f"exit status {status.strip().decode('utf-8', 'replace')}"
+                    )
+            else:
+                success = False
+                error_msg = missing_msg
+
+            if action == "grant":
+                message = (
+                    f"Granted {permission} to {package}"
+                    if success
+                    else self._grant_error_message(package, permission, error_msg)
+                )
+            else:
+                message = (
+                    f"Revoked {permission} from {package}"
+                    if success
+                    else f"Failed to revoke permission: {error_msg}"
+                )
+            results[i] = (success, message)
+
+        return results
+
     def list_app_permissions(self, package: str) -> tuple:
         """
         List all permissions for an app.
@@ -158,38 +314,22 @@ class PrivacyManager:
         cmd = build_adb_command("shell", self.serial, "dumpsys", "package", package)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-            # Parse dumpsys output for permissions
-            granted_permissions = []
-            requested_permissions = []
-
-            in_granted_section = False
-            in_requested_section = False
-
-            for line in result.stdout.split("\n"):
-                stripped = line.strip()
-
-                # Look for sections
-                if "granted permissions:" in stripped.lower():
-                    in_granted_section = True
-                    in_requested_section = False
-                    continue
-                elif "requested permissions:" in stripped.lower():
-                    in_requested_section = True
-                    in_granted_section = False
-                    continue
-                elif stripped and not stripped.startswith("android.permission."):
-                    in_granted_section = False
-                    in_requested_section = False
-
-                # Parse permissions
-                if in_granted_section and "android.permission." in stripped:
-                    perm = stripped.strip()
-                    granted_permissions.append(perm)
-                elif in_requested_section and "android.permission." in stripped:
-                    perm = stripped.split(":")[0].strip()
-                    requested_permissions.append(perm)
+            result = subprocess.run(cmd, capture_output=True, check=True)
+            output = result.stdout
+            if not output.endswith(b"\n"):
+                output += b"\n"
+
+            # Parse dumpsys output for permissions (on bytes; only names are decoded)
+            granted_permissions = [
+                m.group().strip().decode("utf-8", "replace")
+                for section in _GRANTED_RE.finditer(output)
+                for m in _PERM_LINE_RE.finditer(section.group(1))
+            ]
+            requested_permissions = [
+                m.group().split(b":")[0].strip().decode("utf-8", "replace")
+                for section in _REQUESTED_RE.finditer(output)
+                for m in _PERM_LINE_RE.finditer(section.group(1))
+            ]
 
             permissions_data = {
                 "package": package,
@@ -200,7 +340,7 @@ class PrivacyManager:
             return True, "Permissions retrieved", permissions_data
 
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+            error_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
             return False, f"Failed to list permissions: {error_msg}", None
 
 
@@ -220,6 +360,9 @@ Examples:
   # Grant multiple permissions
   python scripts/privacy_manager.py --grant camera,location,storage --package com.myapp
 
+  # Grant multiple permissions with concurrent adb calls
+  python scripts/privacy_manager.py --grant camera,location --package com.myapp --parallel
+
   # List app permissions
   python scripts/privacy_manager.py --list --package com.myapp
 
@@ -244,6 +387,11 @@ Examples:
         "--list-permissions", action="store_true", help="List available permission names"
     )
 
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Grant/revoke with concurrent per-permission adb calls instead of one batched shell",
+    )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
 
@@ -280,13 +428,16 @@ Examples:
             if success:
                 print(f"Permissions for {args.package}:")
                 print(f"\nGranted ({len(perms_data['granted'])}):")
+                reverse = manager.REVERSE_PERMISSIONS
                 for perm in perms_data["granted"]:
-                    print(f"  ✓ {perm}")
+                    short = reverse.get(perm)
+                    print(f"  ✓ {perm}" + (f" ({short})" if short else ""))
                 print(f"\nRequested ({len(perms_data['requested'])}):")
+                granted_set = set(perms_data["granted"])
                 for perm in perms_data["requested"]:
-                    granted = perm in perms_data["granted"]
-                    symbol = "✓" if granted else "✗"
-                    print(f"  {symbol} {perm}")
+                    symbol = "✓" if perm in granted_set else "✗"
+                    short = reverse.get(perm)
+                    print(f"  {symbol} {perm}" + (f" ({short})" if short else ""))
             else:
                 print(message, file=sys.stderr)
 
@@ -297,8 +448,9 @@ Examples:
         permissions = [p.strip() for p in args.grant.split(",")]
         results = []
 
-        for permission in permissions:
-            success, message = manager.grant_permission(args.package, permission)
+        batch = manager.grant_many(args.package, permissions, parallel=args.parallel)
+
+        for permission, (success, message) in zip(permissions, batch):
             results.append({"permission": permission, "success": success, "message": message})
 
             if args.verbose or not success:
@@ -316,8 +468,9 @@ Examples:
         permissions = [p.strip() for p in args.revoke.split(",")]
         results = []
 
-        for permission in permissions:
-            success, message = manager.revoke_permission(args.package, permission)
+        batch = manager.revoke_many(args.package, permissions, parallel=args.parallel)
+
+        for permission, (success, message) in zip(permissions, batch):
             results.append({"permission": permission, "success": success, "message": message})
 
             if args.verbose or not success:
@@ -17,11 +17,15 @@ Usage Examples:
 """
 
 import argparse
+import asyncio
 import json
+import shlex
 import subprocess
 import sys
 from typing import Optional
 
+from common import json_utils
+from common.adb_session import AdbSession
 from common.device_utils import build_adb_command
 
 
@@ -36,6 +40,10 @@ class PushNotificationSimulator:
             serial: Optional device serial
         """
         self.serial = serial
+        # One persistent adb shell for all commands from this simulator
+        self.session = AdbSession(serial)
+        # Device-select prefix for one-off adb processes (async sends)
+        self._shell_prefix = tuple(build_adb_command("shell", serial))
 
     def send_notification(
         self,
@@ -58,41 +66,97 @@ class PushNotificationSimulator:
         """
         # Method 1: Use am broadcast to send intent
         # This requires the app to have a BroadcastReceiver set up
+        args = self._broadcast_args(package, title, message, data)
 
-        cmd = build_adb_command(
-            "shell",
-            self.serial,
+        try:
+            # Only the exit status matters; drop am's stdout on the device
+            self.session.run(f"{shlex.join(args)} >/dev/null", check=True)
+            return True, f"Notification sent: {title}"
+
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
+            return False, f"Failed to send notification: {error_msg}"
+
+    async def send_notification_async(
+        self,
+        package: str,
+        title: str,
+        message: str,
+        data: Optional[dict] = None,
+    ) -> tuple:
+        """
+        Send a notification without blocking the event loop.
+
+        Same broadcast as send_notification(), but runs its own adb process
+        via asyncio so sends to several devices can overlap (see fanout()).
+
+        Args:
+            package: App package name
+            title: Notification title
+            message: Notification message
+            data: Optional data payload
+
+        Returns:
+            (success, message) tuple
+        """
+        args = self._broadcast_args(package, title, message, data)
+
+        proc = await asyncio.create_subprocess_exec(
+            *self._shell_prefix,
+            shlex.join(args),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+
+        if proc.returncode != 0:
+            error_msg = stderr.decode("utf-8", "replace") or f"exit status {proc.returncode}"
+            return False, f"Failed to send notification: {error_msg}"
+        return True, f"Notification sent: {title}"
+
+    @staticmethod
+    def _broadcast_args(
+        package: str, title: str, message: str, data: Optional[dict] = None
+    ) -> list:
+        """
+        Build the `am broadcast` argv for a notification.
+
+        Values are kept as raw argv entries; callers quote them with
+        shlex.join() for the device shell. The broadcast is sent with
+        --receiver-foreground so the receiver is dispatched on the
+        foreground queue instead of waiting behind background broadcasts.
+
+        Args:
+            package: App package name
+            title: Notification title
+            message: Notification message
+            data: Optional data payload
+
+        Returns:
+            List of command arguments
+        """
+        args = [
             "am",
             "broadcast",
+            "--receiver-foreground",
             "-a",
             f"{package}.NOTIFICATION",
             "-n",
             f"{package}/.NotificationReceiver",
             "--es",
             "title",
-            f'"{title}"',
+            title,
             "--es",
             "message",
-            f'"{message}"',
-        )
+            message,
+        ]
 
         # Add data if provided
         if data:
             for key, value in data.items():
-                cmd.extend(["--es", key, f'"{value}"'])
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-            # Check if broadcast was successful
-            if "result=" in result.stdout.lower() or "broadcast" in result.stdout.lower():
-                return True, f"Notification sent: {title}"
-            else:
-                return False, "Failed to send notification (receiver not found)"
+                args.extend(["--es", key, str(value)])
 
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            return False, f"Failed to send notification: {error_msg}"
+        return args
 
     def send_notification_via_service(
         self,
@@ -117,30 +181,29 @@ class PushNotificationSimulator:
         # This is more complex and requires parsing service IDs
 
         # For now, we'll use a simpler approach: start the app with intent extras
-        cmd = build_adb_command(
-            "shell",
-            self.serial,
+        args = [
             "am",
             "start",
             "-n",
             f"{package}/.MainActivity",
             "--es",
             "notification_title",
-            f'"{title}"',
+            title,
             "--es",
             "notification_message",
-            f'"{message}"',
+            message,
             "--ei",
             "notification_id",
             str(notification_id),
-        )
+        ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Only the exit status matters; drop am's stdout on the device
+            self.session.run(f"{shlex.join(args)} >/dev/null", check=True)
             return True, f"Notification sent via intent: {title}"
 
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+            error_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
             return False, f"Failed to send notification: {error_msg}"
 
     def test_notification_channel(self, package: str) -> tuple:
@@ -153,23 +216,17 @@ class PushNotificationSimulator:
         Returns:
             (success, message, channels) tuple
         """
-        cmd = build_adb_command(
-            "shell",
-            self.serial,
-            "cmd",
-            "notification",
-            "list",
-            "channels",
-            package,
-        )
+        args = ["cmd", "notification", "list", "channels", package]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = self.session.run(shlex.join(args), check=True)
 
-            channels = []
-            for line in result.stdout.split("\n"):
-                if "channelId" in line:
-                    channels.append(line.strip())
+            # Filter on the raw bytes; only matching lines are decoded
+            channels = [
+                line.strip().decode("utf-8", "replace")
+                for line in result.stdout.splitlines()
+                if b"channelId" in line
+            ]
 
             if channels:
                 return True, f"Found {len(channels)} notification channel(s)", channels
@@ -177,10 +234,36 @@ class PushNotificationSimulator:
                 return True, "No notification channels found (app may not have created any)", []
 
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+            error_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
             return False, f"Failed to check channels: {error_msg}", None
 
 
+async def fanout(
+    serials: list,
+    package: str,
+    title: str,
+    message: str,
+    data: Optional[dict] = None,
+) -> list:
+    """
+    Broadcast the same notification to several devices concurrently.
+
+    Args:
+        serials: Device serials
+        package: App package name
+        title: Notification title
+        message: Notification message
+        data: Optional data payload
+
+    Returns:
+        List of (success, message) tuples, in serial order
+    """
+    simulators = [PushNotificationSimulator(serial) for serial in serials]
+    return await asyncio.gather(
+        *[sim.send_notification_async(package, title, message, data) for sim in simulators]
+    )
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -191,6 +274,9 @@ Examples:
   # Send simple notification
   python scripts/push_notification.py --package com.myapp --title "Hello" --message "Test"
 
+  # Send the same notification to several devices at once
+  python scripts/push_notification.py --package com.myapp --title "Hi" --message "Test" --serials emulator-5554,emulator-5556
+
   # Send with notification ID
   python scripts/push_notification.py --package com.myapp --title "Alert" --message "Important" --id 123
 
@@ -222,6 +308,10 @@ Note:
     parser.add_argument(
         "--serial", dest="device_serial", help="Device serial (uses default if not specified)"
     )
+    parser.add_argument(
+        "--serials",
+        help="Broadcast to several devices concurrently (comma-separated serials)",
+    )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
 
@@ -240,9 +330,7 @@ Note:
 
         if args.json:
             print(
-                json.dumps(
-                    {"success": success, "message": message, "channels": channels}, indent=2
-                )
+                json_utils.dumps({"success": success, "message": message, "channels": channels})
             )
         else:
             print(message)
@@ -268,6 +356,31 @@ Note:
             print(f"Error: Invalid JSON data: {args.data}", file=sys.stderr)
             sys.exit(1)
 
+    # Fan out across devices
+    if args.serials:
+        if args.method != "broadcast":
+            print("Error: --serials is only supported with --method broadcast", file=sys.stderr)
+            sys.exit(1)
+
+        serials = [s.strip() for s in args.serials.split(",") if s.strip()]
+        results = asyncio.run(fanout(serials, args.package, args.title, args.message, data))
+        success = all(ok for ok, _ in results)
+
+        if args.json:
+            output = {
+                "success": success,
+                "results": [
+                    {"serial": serial, "success": ok, "message": msg}
+                    for serial, (ok, msg) in zip(serials, results)
+                ],
+            }
+            print(json_utils.dumps(output))
+        else:
+            for serial, (_, msg) in zip(serials, results):
+                print(f"[{serial}] {msg}")
+
+        sys.exit(0 if success else 1)
+
     # Send notification
     if args.method == "broadcast":
         success, message = simulator.send_notification(
@@ -279,7 +392,7 @@ Note:
         )
 
     if args.json:
-        print(json.dumps({"success": success, "message": message}, indent=2))
+        print(json_utils.dumps({"success": success, "message": message}))
     else:
         if args.verbose or not success:
             print(message)
@@ -40,45 +40,70 @@ Output Format (default):
     Focusable: 7 elements
 
 Technical Details:
-- Uses uiautomator dump via `adb shell uiautomator dump`
-- Parses XML hierarchy with accessibility attributes
+- Uses uiautomator dump streamed via `adb exec-out uiautomator dump /dev/tty`
+- Parses XML hierarchy incrementally with iterparse (lxml if installed)
 - Identifies element types: Button, EditText, TextView, ImageView, etc.
 - Extracts labels from content-desc, text, and resource-id attributes
 """
 
 import argparse
-from typing import Optional
-import json as json_lib
+from io import BytesIO
+from typing import Callable, Optional
+import re
+import shlex
 import subprocess
 import sys
-import xml.etree.ElementTree as ET
-from collections import defaultdict
+import time
 from pathlib import Path
 
-from common.device_utils import build_adb_command, resolve_device_identifier
+# Prefer lxml (libxml2 C parser) for UI dumps, but make it optional
+try:
+    import lxml.etree as ET
 
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
 
-class ScreenMapper:
-    """
-    Analyzes current screen for navigation decisions.
+    HAS_LXML = False
 
-    This class fetches the Android UI hierarchy from uiautomator and analyzes it
-    to provide actionable summaries for navigation. It categorizes elements
-    by type, counts interactive elements, and identifies key UI patterns.
+from common import json_utils
+from common.adb_session import AdbSession
+from common.device_utils import (
+    build_adb_command,
+    dump_ui_xml,
+    extract_hierarchy_xml,
+    resolve_device_identifier,
+)
 
-    Attributes:
-        serial: Device serial number, or None for default device
-        INTERACTIVE_TYPES: Element types that users can interact with
+# Separates the UI dump from the window focus lines in the batched device read
+_STATE_SEPARATOR = "__SCREEN_MAPPER_FOCUS__"
 
-    Design Philosophy:
-        - Token efficiency: Provide minimal but complete information
-        - Progressive disclosure: Summary by default, details on request
-        - Navigation-focused: Highlight elements relevant for automation
-    """
+# Window focus lines only, filtered on the device
+_FOCUS_COMMAND = "dumpsys window windows | grep -E 'mCurrentFocus|mFocusedApp'"
+
+# Device script for the batched UI dump + window focus read
+_STATE_SCRIPT = (
+    f"uiautomator dump /dev/tty; echo {_STATE_SEPARATOR}; {_FOCUS_COMMAND}; true"
+)
+
+# Long-running variant for map_screen_streaming(): one state read per input line
+_STREAM_END = "__SCREEN_MAPPER_END__"
+_STREAM_SCRIPT = f"while read _; do {_STATE_SCRIPT}; echo {_STREAM_END}; done"
+
+# Focused activity in dumpsys window output
+# Format: mCurrentFocus=Window{abc123 u0 com.example.app/com.example.app.MainActivity}
+_FOCUS_RE = re.compile(r"mCurrentFocus=.*?([A-Za-z0-9_]+Activity)")
+
+# How long a detected screen name is reused while the foreground package is unchanged
+FOCUS_CACHE_TTL = 1.0  # seconds
 
-    # Element types we care about for navigation
-    # These are Android View class names that indicate user interaction points
-    INTERACTIVE_TYPES = {
+
+# Element types we care about for navigation
+# These are Android View class names that indicate user interaction points.
+# Interned so membership hits on interned class names compare by identity.
+_INTERACTIVE = frozenset(
+    sys.intern(name)
+    for name in (
         "Button",
         "ImageButton",
         "EditText",
@@ -92,7 +117,116 @@ class ScreenMapper:
         "TabWidget",
         "ListView",
         "RecyclerView",
-    }
+    )
+)
+
+
+def _build_node_analyzer(interactive: frozenset, labels: bool = True) -> Callable:
+    """
+    Build the per-node analysis function used by analyze_tree.
+
+    The interactive type set and helpers are bound once as closure
+    variables, so the hot loop does no global or attribute lookups for them.
+
+    Args:
+        interactive: Simple class names treated as interaction points
+        labels: Collect element labels; if False, only counters are updated
+
+    Returns:
+        Function(node, analysis) that folds one hierarchy node into analysis
+    """
+    intern = sys.intern
+
+    def analyze_node(node, analysis: dict) -> None:
+        # Get element attributes
+        get = node.get
+        elem_class = get("class", "")
+        if not elem_class:
+            return
+
+        # Extract simple class name (e.g., "android.widget.Button" -> "Button")
+        simple_class = intern(elem_class[elem_class.rfind(".") + 1 :] or "Unknown")
+
+        # Count element
+        analysis["total_elements"] += 1
+
+        focusable = get("focusable", "false") == "true"
+
+        if simple_class not in interactive:
+            # Layout containers etc. only count towards focusable
+            if focusable and get("enabled", "true") == "true":
+                analysis["focusable"] += 1
+            return
+
+        if get("enabled", "true") != "true":
+            return
+
+        clickable = get("clickable", "false") == "true"
+
+        # Track interactive elements
+        if clickable or focusable:
+            analysis["interactive_elements"] += 1
+
+        # Count focusable
+        if focusable:
+            analysis["focusable"] += 1
+
+        if not labels:
+            return
+
+        text = get("text", "")
+        content_desc = get("content-desc", "")
+        resource_id = get("resource-id", "")
+
+        # Determine label for this element
+        label = text or content_desc or resource_id or None
+
+        if label:
+            elements_by_type = analysis["elements_by_type"]
+            bucket = elements_by_type.get(simple_class)
+            if bucket is None:
+                elements_by_type[simple_class] = bucket = []
+            bucket.append(label)
+
+        # Special handling for common types
+        if simple_class == "Button":
+            if label:
+                analysis["buttons"].append(label)
+        elif simple_class == "EditText":
+            is_filled = bool(text)
+            analysis["edit_texts"].append(
+                {"label": content_desc or resource_id or "Unnamed", "filled": is_filled}
+            )
+            if is_filled:
+                analysis["edit_texts_filled"] += 1
+        elif simple_class == "TextView":
+            # Only track clickable TextViews (often used as buttons)
+            if label and clickable:
+                analysis["text_views"].append(label)
+
+    return analyze_node
+
+
+class ScreenMapper:
+    """
+    Analyzes current screen for navigation decisions.
+
+    This class fetches the Android UI hierarchy from uiautomator and analyzes it
+    to provide actionable summaries for navigation. It categorizes elements
+    by type, counts interactive elements, and identifies key UI patterns.
+
+    Attributes:
+        serial: Device serial number, or None for default device
+        INTERACTIVE_TYPES: Element types that users can interact with (frozenset)
+
+    Design Philosophy:
+        - Token efficiency: Provide minimal but complete information
+        - Progressive disclosure: Summary by default, details on request
+        - Navigation-focused: Highlight elements relevant for automation
+    """
+
+    # Element types we care about for navigation (see _INTERACTIVE)
+    INTERACTIVE_TYPES = _INTERACTIVE
 
     def __init__(self, serial: Optional[str] = None):
         """
@@ -106,165 +240,280 @@ class ScreenMapper:
             mapper = ScreenMapper()  # Uses default device
         """
         self.serial = serial
-
-    def get_ui_hierarchy(self) -> ET.Element:
+        self._analyze_node = _build_node_analyzer(_INTERACTIVE)
+        self._count_node = _build_node_analyzer(_INTERACTIVE, labels=False)
+        # Persistent adb shell for text queries (dumps still use exec-out)
+        self.session = AdbSession(serial)
+        # The batched state read is the same on every poll; build it once
+        self._state_cmd = tuple(
+            build_adb_command("exec-out", serial, "sh", "-c", shlex.quote(_STATE_SCRIPT))
+        )
+        # Last detected screen: (monotonic time, screen name, root package)
+        self._focus_cache: Optional[tuple] = None
+        # Long-running state reader (see open_stream())
+        self._stream: Optional[subprocess.Popen] = None
+
+    def get_ui_hierarchy(self) -> bytes:
         """
         Fetch UI hierarchy from Android device via uiautomator dump.
 
+        The dump is streamed over exec-out and returned unparsed, so
+        analyze_tree() can parse it incrementally.
+
         Returns:
-            XML root element
+            Raw XML bytes
 
         Raises:
             RuntimeError: If UI dump fails
         """
         try:
-            # Dump UI hierarchy to device
-            dump_cmd = build_adb_command(
-                "shell", self.serial, "uiautomator", "dump", "/sdcard/window_dump.xml"
-            )
-            result = subprocess.run(dump_cmd, capture_output=True, text=True, check=True)
+            # Stream the dump straight from the device (no /sdcard pull, no temp file)
+            return dump_ui_xml(self.serial)
 
-            if "ERROR" in result.stdout or "error" in result.stderr.lower():
-                raise RuntimeError(f"UI dump failed: {result.stdout or result.stderr}")
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode("utf-8", "replace") if e.stderr else ""
+            raise RuntimeError(f"Failed to get UI hierarchy: {stderr}") from e
+
+    def _fetch_device_state(self) -> tuple:
+        """
+        Fetch the UI dump and window focus info in a single adb round trip.
 
-            # Pull XML file to local temp
-            temp_file = "/tmp/android_window_dump.xml"
-            pull_cmd = build_adb_command("pull", self.serial, "/sdcard/window_dump.xml", temp_file)
-            subprocess.run(pull_cmd, capture_output=True, text=True, check=True)
+        Runs `uiautomator dump /dev/tty` and `dumpsys window windows | grep`
+        in one device shell, separated by a marker line. Falls back to
+        get_ui_hierarchy() if the batched dump returned no hierarchy.
 
-            # Parse XML
-            tree = ET.parse(temp_file)
-            return tree.getroot()
+        Returns:
+            (xml_bytes, focus_output) tuple
 
+        Raises:
+            RuntimeError: If the device read fails
+        """
+        try:
+            result = subprocess.run(self._state_cmd, capture_output=True, check=True)
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to get UI hierarchy: {e.stderr}") from e
-        except ET.ParseError as e:
-            raise RuntimeError(f"Failed to parse UI hierarchy XML: {e}") from e
+            stderr = e.stderr.decode("utf-8", "replace") if e.stderr else ""
+            raise RuntimeError(f"Failed to get UI hierarchy: {stderr}") from e
+
+        return self._split_state(result.stdout)
 
-    def analyze_tree(self, root: ET.Element) -> dict:
+    def _split_state(self, output: bytes) -> tuple:
         """
-        Analyze UI hierarchy for navigation info.
+        Split batched state output into the UI dump and window focus lines.
 
         Args:
-            root: XML root element from uiautomator dump
+            output: Raw output of _STATE_SCRIPT
 
         Returns:
-            Analysis dict with element counts and summaries
+            (xml_bytes, focus_output) tuple
         """
-        analysis = {
-            "elements_by_type": defaultdict(list),
-            "total_elements": 0,
-            "interactive_elements": 0,
-            "edit_texts": [],
-            "buttons": [],
-            "text_views": [],
-            "screen_name": None,
-            "focusable": 0,
-        }
-
-        self._analyze_recursive(root, analysis)
-
-        # Post-process for clean output
-        analysis["elements_by_type"] = dict(analysis["elements_by_type"])
+        dump_output, _, focus_output = output.rpartition(_STATE_SEPARATOR.encode())
+        xml_bytes = extract_hierarchy_xml(dump_output)
+        if xml_bytes is None:
+            # Dump to /dev/tty not supported: use the file-based fallback
+            xml_bytes = self.get_ui_hierarchy()
 
-        # Try to determine screen name from activity
-        self._detect_screen_name(analysis)
+        return xml_bytes, focus_output.decode("utf-8", "replace")
 
-        return analysis
+    def open_stream(self) -> None:
+        """
+        Start a long-running device shell that serves state reads on demand.
+
+        The shell runs the batched dump + focus script once per line written
+        to its stdin, so repeated polls reuse one adb process instead of
+        spawning one per map_screen() call. Uses `adb shell` because
+        exec-out does not forward stdin.
+        """
+        if self._stream is not None and self._stream.poll() is None:
+            return
+
+        cmd = build_adb_command("shell", self.serial, "sh", "-c", shlex.quote(_STREAM_SCRIPT))
+        self._stream = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+
+    def _read_stream_state(self) -> tuple:
+        """
+        Request one state read from the open stream.
+
+        Returns:
+            (xml_bytes, focus_output) tuple
+
+        Raises:
+            RuntimeError: If the stream process has exited
+        """
+        proc = self._stream
+        end_marker = _STREAM_END.encode()
+        chunks = []
 
-    def _analyze_recursive(self, node: ET.Element, analysis: dict):
+        try:
+            proc.stdin.write(b"\n")
+            proc.stdin.flush()
+            for line in iter(proc.stdout.readline, b""):
+                if line.rstrip() == end_marker:
+                    return self._split_state(b"".join(chunks))
+                chunks.append(line)
+        except (BrokenPipeError, ValueError):
+            pass
+
+        self.close_stream()
+        raise RuntimeError("Failed to get UI hierarchy: UI stream closed unexpectedly")
+
+    def close_stream(self) -> None:
+        """Stop the streaming state reader, if running."""
+        proc, self._stream = self._stream, None
+        if proc is None:
+            return
+        try:
+            # EOF ends the device-side read loop
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def analyze_tree(
+        self, xml_bytes: bytes, focus_output: Optional[str] = None, counts_only: bool = False
+    ) -> dict:
         """
-        Recursively analyze XML nodes.
+        Analyze UI hierarchy for navigation info.
+
+        Parses the dump incrementally with iterparse: each node is analyzed
+        when it opens (document order) and freed when it closes, so memory
+        stays proportional to tree depth. The walk is a flat event loop on
+        both the lxml and stdlib parsers, so deeply nested layouts cannot
+        hit Python's recursion limit.
 
         Args:
-            node: Current XML element
-            analysis: Analysis dict to populate
+            xml_bytes: Raw XML from uiautomator dump
+            focus_output: Window focus lines from dumpsys (queried from the
+                device if None)
+            counts_only: Only count elements; skip label collection and omit
+                the element lists from the result
+
+        Returns:
+            Analysis dict with element counts and summaries
+
+        Raises:
+            RuntimeError: If the XML cannot be parsed
         """
-        # Get element attributes
-        elem_class = node.get("class", "")
-        text = node.get("text", "")
-        content_desc = node.get("content-desc", "")
-        resource_id = node.get("resource-id", "")
-        clickable = node.get("clickable", "false") == "true"
-        focusable = node.get("focusable", "false") == "true"
-        enabled = node.get("enabled", "true") == "true"
+        if counts_only:
+            analysis = {
+                "total_elements": 0,
+                "interactive_elements": 0,
+                "screen_name": None,
+                "root_package": None,
+                "focusable": 0,
+            }
+            analyze_node = self._count_node
+        else:
+            analysis = {
+                "elements_by_type": {},
+                "total_elements": 0,
+                "interactive_elements": 0,
+                "edit_texts": [],
+                "edit_texts_filled": 0,
+                "buttons": [],
+                "text_views": [],
+                "screen_name": None,
+                "root_package": None,
+                "focusable": 0,
+            }
+            analyze_node = self._analyze_node
+
+        root_package = None
 
-        # Extract simple class name (e.g., "android.widget.Button" -> "Button")
-        simple_class = elem_class.split(".")[-1] if elem_class else "Unknown"
+        try:
+            for event, node in ET.iterparse(BytesIO(xml_bytes), events=("start", "end")):
+                if event == "end":
+                    # Node was analyzed on "start"; free it and earlier siblings
+                    node.clear()
+                    if HAS_LXML:
+                        while node.getprevious() is not None:
+                            del node.getparent()[0]
+                    continue
 
-        # Count element
-        if elem_class:
-            analysis["total_elements"] += 1
-
-            # Determine label for this element
-            label = text or content_desc or resource_id or None
-
-            # Track interactive elements
-            if simple_class in self.INTERACTIVE_TYPES and enabled:
-                if clickable or focusable:
-                    analysis["interactive_elements"] += 1
-
-                if label:
-                    analysis["elements_by_type"][simple_class].append(label)
-
-                # Special handling for common types
-                if simple_class == "Button" and label:
-                    analysis["buttons"].append(label)
-                elif simple_class == "EditText":
-                    is_filled = bool(text)
-                    analysis["edit_texts"].append(
-                        {"label": content_desc or resource_id or "Unnamed", "filled": is_filled}
-                    )
-                elif simple_class == "TextView" and label and clickable:
-                    # Only track clickable TextViews (often used as buttons)
-                    analysis["text_views"].append(label)
-
-            # Count focusable
-            if focusable and enabled:
-                analysis["focusable"] += 1
+                if root_package is None and node.get("class"):
+                    root_package = node.get("package")
 
-        # Recurse to children
-        for child in node:
-            self._analyze_recursive(child, analysis)
+                analyze_node(node, analysis)
 
-    def _detect_screen_name(self, analysis: dict):
+        except ET.ParseError as e:
+            raise RuntimeError(f"Failed to parse UI hierarchy XML: {e}") from e
+
+        analysis["root_package"] = root_package
+
+        # Try to determine screen name from activity
+        if focus_output is None:
+            self._detect_screen_name(analysis, root_package)
+        else:
+            analysis["screen_name"] = self._parse_focus(focus_output)
+            self._focus_cache = (time.monotonic(), analysis["screen_name"], root_package)
+
+        # No focused activity found: the app package is the best name we have
+        if analysis["screen_name"] is None:
+            analysis["screen_name"] = root_package
+
+        return analysis
+
+    def _detect_screen_name(self, analysis: dict, root_package: Optional[str] = None):
         """
         Try to detect screen/activity name from UI elements.
 
         Looks for common patterns like ActionBar titles, TextViews with IDs containing "title", etc.
+        The last result is reused for FOCUS_CACHE_TTL seconds while the
+        hierarchy's root package stays the same.
 
         Args:
             analysis: Analysis dict to update
+            root_package: Package of the first element in the dump
         """
+        now = time.monotonic()
+        cache = self._focus_cache
+        if (
+            cache is not None
+            and root_package
+            and cache[2] == root_package
+            and now - cache[0] < FOCUS_CACHE_TTL
+        ):
+            analysis["screen_name"] = cache[1]
+            return
+
         # Try to get current activity name from device
         try:
-            cmd = build_adb_command(
-                "shell",
-                self.serial,
-                "dumpsys",
-                "window",
-                "windows",
-            )
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5, shell=False)
-
-            # Look for current focus
-            # Format: mCurrentFocus=Window{abc123 u0 com.example.app/com.example.app.MainActivity}
-            import re
-
-            match = re.search(r"mCurrentFocus=.*?([A-Za-z0-9_]+Activity)", result.stdout)
-            if match:
-                analysis["screen_name"] = match.group(1)
+            result = self.session.run(_FOCUS_COMMAND, timeout=5)
+            analysis["screen_name"] = self._parse_focus(result.stdout.decode("utf-8", "replace"))
 
         except Exception:
             # Fallback: Use package name or None
             analysis["screen_name"] = None
 
+        self._focus_cache = (now, analysis["screen_name"], root_package)
+
+    @staticmethod
+    def _parse_focus(focus_output: str) -> Optional[str]:
+        """
+        Extract the focused activity name from dumpsys window output.
+
+        Args:
+            focus_output: dumpsys window output (or its mCurrentFocus lines)
+
+        Returns:
+            Activity class name, or None if not found
+        """
+        # Look for current focus
+        match = _FOCUS_RE.search(focus_output)
+        return match.group(1) if match else None
+
     def format_summary(self, analysis: dict, verbose: bool = False, hints: bool = False) -> str:
         """
         Format analysis as human-readable summary.
 
         Args:
-            analysis: Analysis dict from analyze_tree()
+            analysis: Analysis dict from analyze_tree() (element lists are
+                optional, e.g. with counts_only)
             verbose: Include detailed element listings
             hints: Include navigation suggestions
 
@@ -280,23 +529,28 @@ class ScreenMapper:
         lines.append(f"Screen: {screen} ({total} elements, {interactive} interactive)")
 
         # Buttons
-        if analysis["buttons"]:
-            button_labels = '", "'.join(analysis["buttons"][:5])
-            if len(analysis["buttons"]) > 5:
-                lines.append(f'Buttons: "{button_labels}", ... ({len(analysis["buttons"])} total)')
+        buttons = analysis.get("buttons")
+        if buttons:
+            n_buttons = len(buttons)
+            button_labels = '", "'.join(buttons[:5])
+            if n_buttons > 5:
+                lines.append(f'Buttons: "{button_labels}", ... ({n_buttons} total)')
             else:
                 lines.append(f'Buttons: "{button_labels}"')
 
         # EditTexts
-        if analysis["edit_texts"]:
-            filled_count = sum(1 for et in analysis["edit_texts"] if et["filled"])
-            lines.append(f"EditTexts: {len(analysis['edit_texts'])} ({filled_count} filled)")
+        edit_texts = analysis.get("edit_texts")
+        if edit_texts:
+            filled_count = analysis["edit_texts_filled"]
+            lines.append(f"EditTexts: {len(edit_texts)} ({filled_count} filled)")
 
         # Clickable TextViews
-        if analysis["text_views"]:
-            text_labels = '", "'.join(analysis["text_views"][:3])
-            if len(analysis["text_views"]) > 3:
-                lines.append(f'Clickable Text: "{text_labels}", ... ({len(analysis["text_views"])} total)')
+        text_views = analysis.get("text_views")
+        if text_views:
+            n_text_views = len(text_views)
+            text_labels = '", "'.join(text_views[:3])
+            if n_text_views > 3:
+                lines.append(f'Clickable Text: "{text_labels}", ... ({n_text_views} total)')
             else:
                 lines.append(f'Clickable Text: "{text_labels}"')
 
@@ -307,7 +561,7 @@ class ScreenMapper:
         # Verbose mode: Show all element types
         if verbose:
             lines.append("\n--- Detailed Element Breakdown ---")
-            for elem_type, elements in sorted(analysis["elements_by_type"].items()):
+            for elem_type, elements in sorted(analysis.get("elements_by_type", {}).items()):
                 lines.append(f"\n{elem_type} ({len(elements)}):")
                 for i, elem in enumerate(elements[:10]):  # Limit to 10 per type
                     lines.append(f"  {i+1}. {elem}")
@@ -317,18 +571,23 @@ class ScreenMapper:
         # Hints mode: Navigation suggestions
         if hints:
             lines.append("\n--- Navigation Hints ---")
-            if analysis["buttons"]:
-                lines.append(f"• Tap buttons: {', '.join(analysis['buttons'][:3])}")
-            if analysis["edit_texts"]:
-                unfilled = [et for et in analysis["edit_texts"] if not et["filled"]]
-                if unfilled:
-                    lines.append(f"• Fill text fields: {unfilled[0]['label']}")
-            if analysis["text_views"]:
-                lines.append(f"• Tap text: {analysis['text_views'][0]}")
+            if buttons:
+                lines.append(f"• Tap buttons: {', '.join(buttons[:3])}")
+            if edit_texts and len(edit_texts) > analysis["edit_texts_filled"]:
+                unfilled = next(et for et in edit_texts if not et["filled"])
+                lines.append(f"• Fill text fields: {unfilled['label']}")
+            if text_views:
+                lines.append(f"• Tap text: {text_views[0]}")
 
         return "\n".join(lines)
 
-    def map_screen(self, verbose: bool = False, hints: bool = False, json_output: bool = False) -> str:
+    def map_screen(
+        self,
+        verbose: bool = False,
+        hints: bool = False,
+        json_output: bool = False,
+        counts_only: bool = False,
+    ) -> str:
         """
         Main entry point: Map current screen and return formatted output.
 
@@ -336,22 +595,59 @@ class ScreenMapper:
             verbose: Include detailed element listings
             hints: Include navigation suggestions
             json_output: Return JSON instead of formatted text
+            counts_only: Only report element counts (see analyze_tree())
+
+        Returns:
+            Formatted summary or JSON string
+        """
+        return self._map(self._fetch_device_state, verbose, hints, json_output, counts_only)
+
+    def map_screen_streaming(
+        self,
+        verbose: bool = False,
+        hints: bool = False,
+        json_output: bool = False,
+        counts_only: bool = False,
+    ) -> str:
+        """
+        Map the current screen over the long-running stream (see open_stream()).
+
+        Same output as map_screen(), for agent loops that poll repeatedly.
+        The stream is opened on first use; call close_stream() when done.
+
+        Args:
+            verbose: Include detailed element listings
+            hints: Include navigation suggestions
+            json_output: Return JSON instead of formatted text
+            counts_only: Only report element counts (see analyze_tree())
 
         Returns:
             Formatted summary or JSON string
         """
+        self.open_stream()
+        return self._map(self._read_stream_state, verbose, hints, json_output, counts_only)
+
+    def _map(
+        self,
+        fetch_state: Callable,
+        verbose: bool,
+        hints: bool,
+        json_output: bool,
+        counts_only: bool,
+    ) -> str:
+        """Fetch device state with fetch_state() and format the analysis."""
         try:
-            root = self.get_ui_hierarchy()
-            analysis = self.analyze_tree(root)
+            xml_bytes, focus_output = fetch_state()
+            analysis = self.analyze_tree(xml_bytes, focus_output, counts_only)
 
             if json_output:
-                return json_lib.dumps(analysis, indent=2)
+                return json_utils.dumps(analysis)
             else:
                 return self.format_summary(analysis, verbose, hints)
 
         except RuntimeError as e:
             if json_output:
-                return json_lib.dumps({"error": str(e)}, indent=2)
+                return json_utils.dumps({"error": str(e)})
             return f"Error: {e}"
 
 
@@ -375,6 +671,9 @@ Examples:
 
   # JSON output
   python screen_mapper.py --json
+
+  # Element counts only (no labels)
+  python screen_mapper.py --counts-only --json
         """,
     )
 
@@ -382,6 +681,9 @@ Examples:
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed element breakdown")
     parser.add_argument("--hints", action="store_true", help="Include navigation suggestions")
     parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    parser.add_argument(
+        "--counts-only", action="store_true", help="Only count elements (skip label collection)"
+    )
 
     args = parser.parse_args()
 
@@ -394,7 +696,12 @@ Examples:
 
     # Map screen
     mapper = ScreenMapper(serial)
-    output = mapper.map_screen(verbose=args.verbose, hints=args.hints, json_output=args.json)
+    output = mapper.map_screen(
+        verbose=args.verbose,
+        hints=args.hints,
+        json_output=args.json,
+        counts_only=args.counts_only,
+    )
 
     print(output)
     sys.exit(0)
@@ -21,15 +21,29 @@ Usage Examples:
 
 import argparse
 import json
+import shlex
 import subprocess
 import sys
 from typing import Optional
 
-from common.device_utils import build_adb_command
+from common.adb_session import AdbSession
+
+# Markers framing each queued operation's output in a batched shell
+_BEGIN_MARKER = "__BEGIN__"
+_END_MARKER = "__END__"
+
+# Command prefixes; they never change, so they are built once as shell strings
+_STATUSBAR = "cmd statusbar"
+_DEMO_COMMAND = "am broadcast -a com.android.systemui.demo -e command"
 
 
 class StatusBarController:
-    """Controls Android status bar appearance."""
+    """Controls Android status bar appearance.
+
+    Setters run immediately by default. With queue_only=True they only
+    queue their shell commands; flush() then runs everything queued in a
+    single command line. All commands go through one persistent adb shell.
+    """
 
     def __init__(self, serial: Optional[str] = None):
         """
@@ -39,78 +53,70 @@ class StatusBarController:
             serial: Optional device serial (auto-detects if None)
         """
         self.serial = serial
+        # One persistent adb shell for every command from this controller
+        self.session = AdbSession(serial)
+        # Queued operations: (commands, success message, failure prefix)
+        self._queue = []
 
-    def set_battery(self, level: int, charging: bool = False) -> tuple:
+    def set_battery(self, level: int, charging: bool = False, queue_only: bool = False):
         """
         Set battery level display.
 
         Args:
             level: Battery level (0-100)
             charging: Show charging indicator
+            queue_only: Queue the commands for flush() instead of running them
 
         Returns:
-            (success, message) tuple
+            (success, message) tuple, or the queued shell commands if queue_only
         """
         if not 0 <= level <= 100:
-            return False, "Battery level must be between 0 and 100"
-
-        # Disable real battery status
-        cmd1 = build_adb_command(
-            "shell", self.serial, "cmd", "statusbar", "battery-level", str(level)
-        )
-
-        try:
-            subprocess.run(cmd1, capture_output=True, text=True, check=True)
+            return self._submit(None, "Battery level must be between 0 and 100", "", queue_only)
 
-            # Set charging status
-            if charging:
-                cmd2 = build_adb_command(
-                    "shell", self.serial, "cmd", "statusbar", "battery-charging", "true"
-                )
-                subprocess.run(cmd2, capture_output=True, text=True, check=True)
+        commands = [f"{_STATUSBAR} battery-level {level}"]
 
-            return True, f"Battery set to {level}%{' (charging)' if charging else ''}"
+        # Set charging status
+        if charging:
+            commands.append(f"{_STATUSBAR} battery-charging true")
 
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            return False, f"Failed to set battery: {error_msg}"
+        return self._submit(
+            commands,
+            f"Battery set to {level}%{' (charging)' if charging else ''}",
+            "Failed to set battery",
+            queue_only,
+        )
 
-    def set_wifi(self, enabled: bool = True, level: int = 4) -> tuple:
+    def set_wifi(self, enabled: bool = True, level: int = 4, queue_only: bool = False):
         """
         Set WiFi indicator.
 
         Args:
             enabled: Show WiFi enabled
             level: Signal level (0-4)
+            queue_only: Queue the commands for flush() instead of running them
 
         Returns:
-            (success, message) tuple
+            (success, message) tuple, or the queued shell commands if queue_only
         """
-        cmd = build_adb_command(
-            "shell",
-            self.serial,
-            "cmd",
-            "statusbar",
-            "wifi-enabled",
-            "true" if enabled else "false",
-        )
-
-        try:
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+        commands = [f"{_STATUSBAR} wifi-enabled {'true' if enabled else 'false'}"]
 
-            if enabled and 0 <= level <= 4:
-                cmd2 = build_adb_command(
-                    "shell", self.serial, "cmd", "statusbar", "wifi-level", str(level)
-                )
-                subprocess.run(cmd2, capture_output=True, text=True, check=True)
+        if enabled and 0 <= level <= 4:
+            commands.append(f"{_STATUSBAR} wifi-level {level}")
 
-            return True, f"WiFi {'enabled' if enabled else 'disabled'} (level: {level})"
-
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            return False, f"Failed to set WiFi: {error_msg}"
+        return self._submit(
+            commands,
+            f"WiFi {'enabled' if enabled else 'disabled'} (level: {level})",
+            "Failed to set WiFi",
+            queue_only,
+        )
 
-    def set_mobile_data(self, enabled: bool = True, level: int = 4, data_type: str = "lte") -> tuple:
+    def set_mobile_data(
+        self,
+        enabled: bool = True,
+        level: int = 4,
+        data_type: str = "lte",
+        queue_only: bool = False,
+    ):
         """
         Set mobile data indicator.
 
@@ -118,133 +124,180 @@ class StatusBarController:
             enabled: Show mobile data enabled
             level: Signal level (0-4)
             data_type: Data type (lte, 3g, 4g, 5g)
+            queue_only: Queue the commands for flush() instead of running them
 
         Returns:
-            (success, message) tuple
+            (success, message) tuple, or the queued shell commands if queue_only
         """
-        cmd = build_adb_command(
-            "shell",
-            self.serial,
-            "cmd",
-            "statusbar",
-            "mobile-enabled",
-            "true" if enabled else "false",
+        commands = [f"{_STATUSBAR} mobile-enabled {'true' if enabled else 'false'}"]
+
+        if enabled:
+            # Set signal level and data type
+            commands.append(f"{_STATUSBAR} mobile-level {level}")
+            commands.append(f"{_STATUSBAR} mobile-datatype {shlex.quote(data_type)}")
+
+        return self._submit(
+            commands,
+            f"Mobile data {'enabled' if enabled else 'disabled'} ({data_type}, level: {level})",
+            "Failed to set mobile data",
+            queue_only,
         )
 
-        try:
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-            if enabled:
-                # Set signal level
-                cmd2 = build_adb_command(
-                    "shell", self.serial, "cmd", "statusbar", "mobile-level", str(level)
-                )
-                subprocess.run(cmd2, capture_output=True, text=True, check=True)
-
-                # Set data type
-                cmd3 = build_adb_command(
-                    "shell", self.serial, "cmd", "statusbar", "mobile-datatype", data_type
-                )
-                subprocess.run(cmd3, capture_output=True, text=True, check=True)
-
-            return True, f"Mobile data {'enabled' if enabled else 'disabled'} ({data_type}, level: {level})"
-
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            return False, f"Failed to set mobile data: {error_msg}"
-
-    def set_time(self, time_str: str) -> tuple:
+    def set_time(self, time_str: str, queue_only: bool = False):
         """
         Set time display (for screenshots).
 
         Args:
             time_str: Time string (e.g., "9:41")
+            queue_only: Queue the commands for flush() instead of running them
 
         Returns:
-            (success, message) tuple
+            (success, message) tuple, or the queued shell commands if queue_only
         """
         # Note: This requires custom implementation as Android doesn't have
         # a built-in command for this. Using demo mode on supported devices.
+        commands = [
+            # Enable demo mode
+            "settings put global sysui_demo_allowed 1",
+            # Enter demo mode
+            f"{_DEMO_COMMAND} enter",
+            # Set time
+            f"{_DEMO_COMMAND} clock -e hhmm {shlex.quote(time_str.replace(':', ''))}",
+        ]
 
-        # Enable demo mode
-        cmd1 = build_adb_command(
-            "shell", self.serial, "settings", "put", "global", "sysui_demo_allowed", "1"
+        return self._submit(
+            commands, f"Time set to {time_str} (demo mode)", "Failed to set time", queue_only
         )
 
-        try:
-            subprocess.run(cmd1, capture_output=True, text=True, check=True)
+    def reset(self, queue_only: bool = False):
+        """
+        Reset status bar to actual system values.
 
-            # Enter demo mode
-            cmd2 = build_adb_command(
-                "shell",
-                self.serial,
-                "am",
-                "broadcast",
-                "-a",
-                "com.android.systemui.demo",
-                "-e",
-                "command",
-                "enter",
-            )
-            subprocess.run(cmd2, capture_output=True, text=True, check=True)
+        Args:
+            queue_only: Queue the commands for flush() instead of running them
 
-            # Set time
-            cmd3 = build_adb_command(
-                "shell",
-                self.serial,
-                "am",
-                "broadcast",
-                "-a",
-                "com.android.systemui.demo",
-                "-e",
-                "command",
-                "clock",
-                "-e",
-                "hhmm",
-                time_str.replace(":", ""),
-            )
-            subprocess.run(cmd3, capture_output=True, text=True, check=True)
+        Returns:
+            (success, message) tuple, or the queued shell commands if queue_only
+        """
+        commands = [
+            # Exit demo mode
+            f"{_DEMO_COMMAND} exit",
+            # Reset statusbar settings (best effort); braced so the || only
+            # covers this write once the commands are chained with &&
+            "{ settings put global sysui_demo_allowed 0 || true; }",
+        ]
+
+        return self._submit(
+            commands, "Status bar reset to actual values", "Failed to reset", queue_only
+        )
+
+    def apply_batch(self, operations: list) -> list:
+        """
+        Queue several setter calls and run them in a single command line.
 
-            return True, f"Time set to {time_str} (demo mode)"
+        Anything queued earlier with queue_only=True runs first; only the
+        results for these operations are returned.
 
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            return False, f"Failed to set time: {error_msg}"
+        Args:
+            operations: (setter name, args) pairs, e.g. ("set_wifi", (True, 4))
+
+        Returns:
+            List of (success, message) tuples, one per operation
 
-    def reset(self) -> tuple:
+        Example:
+            controller.apply_batch([("set_battery", (100,)), ("set_time", ("9:41",))])
         """
-        Reset status bar to actual system values.
+        for setter, setter_args in operations:
+            getattr(self, setter)(*setter_args, queue_only=True)
+
+        results = self.flush()
+        return results[len(results) - len(operations) :]
+
+    def flush(self) -> list:
+        """
+        Run all queued operations in a single adb shell.
 
         Returns:
-            (success, message) tuple
+            List of (success, message) tuples, in queue order
         """
-        # Exit demo mode
-        cmd = build_adb_command(
-            "shell",
-            self.serial,
-            "am",
-            "broadcast",
-            "-a",
-            "com.android.systemui.demo",
-            "-e",
-            "command",
-            "exit",
-        )
+        operations, self._queue = self._queue, []
+        return self._run_operations(operations)
 
-        try:
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+    def _submit(self, commands: Optional[list], message: str, failure: str, queue_only: bool):
+        """
+        Queue or run one operation.
 
-            # Reset statusbar settings
-            cmd2 = build_adb_command(
-                "shell", self.serial, "settings", "put", "global", "sysui_demo_allowed", "0"
+        Args:
+            commands: Shell commands, run in order until one fails (None for
+                an operation that already failed validation)
+            message: Success message (or the error message if commands is None)
+            failure: Prefix for the error message if a command fails
+            queue_only: Queue instead of running
+
+        Returns:
+            (success, message) tuple, or the queued commands if queue_only
+        """
+        operation = (commands, message, failure)
+        if queue_only:
+            self._queue.append(operation)
+            return commands or []
+        return self._run_operations([operation])[0]
+
+    def _run_operations(self, operations: list) -> list:
+        """
+        Run operations as one command line in the session's device shell.
+
+        Each operation's commands are chained with && and wrapped in
+        begin/end markers, so its stderr and exit status can be attributed
+        to the right operation.
+
+        Args:
+            operations: (commands, success message, failure prefix) tuples
+
+        Returns:
+            List of (success, message) tuples, one per operation
+        """
+        results = [None] * len(operations)
+        pending = []
+        script_parts = []
+
+        for i, (commands, message, _) in enumerate(operations):
+            if commands is None:
+                results[i] = (False, message)
+                continue
+            pending.append(i)
+            script_parts.append(
+                f"echo {_BEGIN_MARKER}; "
+                f"{{ {' && '.join(commands)}; }} 2>&1 >/dev/null; "
+                f"echo {_END_MARKER}$?"
             )
-            subprocess.run(cmd2, capture_output=True, text=True)
 
-            return True, "Status bar reset to actual values"
+        if not pending:
+            return results
 
+        try:
+            result = self.session.run("; ".join(script_parts))
+            blocks = result.stdout.split(_BEGIN_MARKER.encode() + b"\n")[1:]
+            missing_msg = "no result from device shell"
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            return False, f"Failed to reset: {error_msg}"
+            # The adb shell itself went away
+            blocks = []
+            missing_msg = e.stderr.decode("utf-8", "replace").strip() if e.stderr else str(e)
+
+        for n, i in enumerate(pending):
+            _, message, failure = operations[i]
+            if n < len(blocks):
+                output, _, status = blocks[n].rpartition(_END_MARKER.encode())
+                status = status.strip().decode("utf-8", "replace")
+                if status == "0":
+                    results[i] = (True, message)
+                    continue
+                error_msg = output.strip().decode("utf-8", "replace") or f"exit status {status}"
+            else:
+                error_msg = missing_msg
+            results[i] = (False, f"{failure}: {error_msg}")
+
+        return results
 
 
 def main():
@@ -291,34 +344,27 @@ Examples:
     args = parser.parse_args()
 
     controller = StatusBarController(serial=args.device_serial)
-    results = []
-
-    # Reset operation
-    if args.reset:
-        success, message = controller.reset()
-        results.append({"operation": "reset", "success": success, "message": message})
-
-    # Battery operation
-    if args.battery is not None:
-        success, message = controller.set_battery(args.battery, args.charging)
-        results.append({"operation": "battery", "success": success, "message": message})
-
-    # WiFi operation
-    if args.wifi:
-        success, message = controller.set_wifi(True, args.wifi_level)
-        results.append({"operation": "wifi", "success": success, "message": message})
-
-    # Mobile data operation
-    if args.mobile:
-        success, message = controller.set_mobile_data(
-            True, args.mobile_level, args.mobile_type
-        )
-        results.append({"operation": "mobile", "success": success, "message": message})
 
-    # Time operation
-    if args.time:
-        success, message = controller.set_time(args.time)
-        results.append({"operation": "time", "success": success, "message": message})
+    # (operation, requested, setter, setter args), in execution order
+    dispatch = [
+        ("reset", args.reset, "reset", ()),
+        ("battery", args.battery is not None, "set_battery", (args.battery, args.charging)),
+        ("wifi", args.wifi, "set_wifi", (True, args.wifi_level)),
+        ("mobile", args.mobile, "set_mobile_data", (True, args.mobile_level, args.mobile_type)),
+        ("time", bool(args.time), "set_time", (args.time,)),
+    ]
+    requested = [
+        (name, setter, setter_args) for name, wanted, setter, setter_args in dispatch if wanted
+    ]
+
+    # Run every requested operation in one adb shell command
+    batch_results = controller.apply_batch(
+        [(setter, setter_args) for _, setter, setter_args in requested]
+    )
+    results = [
+        {"operation": name, "success": success, "message": message}
+        for (name, _, _), (success, message) in zip(requested, batch_results)
+    ]
 
     # Output results
     if not results:
@@ -11,15 +11,26 @@ Usage:
 """
 
 import argparse
-import json
+import queue
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 from typing import Optional
 
+# Prefer lxml (libxml2 C parser) for UI dumps, but make it optional
+try:
+    import lxml.etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+from common import json_utils
+from common.adb_session import AdbSession
 from common.screenshot_utils import capture_screenshot
-from common.device_utils import get_ui_hierarchy
+from common.device_utils import dump_ui_xml
 
 
 class TestRecorder:
@@ -33,6 +44,8 @@ class TestRecorder:
         inline: bool = False,
         screenshot_size: str = "half",
         app_name: Optional[str] = None,
+        async_capture: bool = False,
+        pretty: bool = False,
     ):
         """
         Initialize test recorder.
@@ -44,31 +57,46 @@ class TestRecorder:
             inline: If True, return screenshots as base64 (for vision-based automation)
             screenshot_size: 'full', 'half', 'quarter', 'thumb' (default: 'half')
             app_name: App name for semantic screenshot naming
+            async_capture: If True, step() queues captures for a background
+                thread and returns immediately; finish() waits for them.
+                Only use this when the test does not change the screen right
+                after step(), since the capture may run later.
+            pretty: Indent JSON artifacts (compact by default)
         """
         self.test_name = test_name
         self.serial = serial
         self.inline = inline
         self.screenshot_size = screenshot_size
         self.app_name = app_name
+        self.pretty = pretty
         self.start_time = time.time()
         self.steps = []
         self.current_step = 0
-
-        # Create timestamped output directory
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        # Persistent adb shell for on-device commands (screencap)
+        self.session = AdbSession(serial)
+        # Screenshot and UI dump of a step are captured concurrently
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        # Deferred captures (async_capture); steps may be filled in by the worker
+        self._steps_lock = threading.Lock()
+        self._capture_queue: Optional[queue.Queue] = queue.Queue() if async_capture else None
+        self._capture_thread: Optional[threading.Thread] = None
+
+        # Create timestamped output directory (microseconds keep it unique,
+        # so it and its subdirectories are always new)
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
         safe_name = test_name.lower().replace(" ", "-")
         self.output_dir = Path(output_dir) / f"{safe_name}-{timestamp}"
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir.mkdir(parents=True)
 
         # Create subdirectories (only if not in inline mode)
         if not inline:
             self.screenshots_dir = self.output_dir / "screenshots"
-            self.screenshots_dir.mkdir(exist_ok=True)
+            self.screenshots_dir.mkdir()
         else:
             self.screenshots_dir = None
 
         self.ui_dumps_dir = self.output_dir / "ui-dumps"
-        self.ui_dumps_dir.mkdir(exist_ok=True)
+        self.ui_dumps_dir.mkdir()
 
         # Token-efficient output
         mode_str = "(inline mode)" if inline else ""
@@ -96,29 +124,93 @@ class TestRecorder:
         self.current_step += 1
         step_time = time.time() - self.start_time
 
-        # Capture screenshot
+        # Artifact paths share one file stem
+        stem = f"{self.current_step:03d}-{description.lower().replace(' ', '-')[:30]}"
+
         screenshot_path = None
         if not self.inline:
-            screenshot_name = f"{self.current_step:03d}-{description.lower().replace(' ', '-')[:30]}.png"
-            screenshot_path = self.screenshots_dir / screenshot_name
+            screenshot_path = self.screenshots_dir / f"{stem}.png"
+
+        ui_dump_path = self.ui_dumps_dir / f"{stem}.json"
+
+        job = (
+            len(self.steps),
+            self.current_step,
+            description,
+            step_time,
+            screenshot_path,
+            ui_dump_path,
+            assertion,
+            metadata,
+        )
 
-        screenshot_result = capture_screenshot(
+        with self._steps_lock:
+            # Reserve the slot so steps stay in order if captured later
+            self.steps.append(None)
+
+        if self._capture_queue is None:
+            self._record_step(*job)
+            return
+
+        if self._capture_thread is None:
+            self._capture_thread = threading.Thread(target=self._capture_worker, daemon=True)
+            self._capture_thread.start()
+        self._capture_queue.put(job)
+
+    def _capture_worker(self):
+        """Background thread: capture queued steps in order (async_capture mode)."""
+        while True:
+            job = self._capture_queue.get()
+            try:
+                self._record_step(*job)
+            except Exception as e:
+                print(f"  Warning: Failed to capture step {job[1]}: {e}")
+            finally:
+                self._capture_queue.task_done()
+
+    def _record_step(
+        self,
+        slot: int,
+        number: int,
+        description: str,
+        step_time: float,
+        screenshot_path: Optional[Path],
+        ui_dump_path: Path,
+        assertion: Optional[str],
+        metadata: Optional[dict],
+    ):
+        """
+        Capture a step's screenshot and UI hierarchy and store its data.
+
+        Args:
+            slot: Index reserved for this step in self.steps
+            number: Step number
+            description: Step description
+            step_time: Seconds since recording started
+            screenshot_path: Screenshot file (None in inline mode)
+            ui_dump_path: UI hierarchy JSON file
+            assertion: Optional assertion to verify
+            metadata: Optional metadata for the step
+        """
+        # Capture screenshot
+        screenshot_future = self._pool.submit(
+            capture_screenshot,
             self.serial,
             output_path=str(screenshot_path) if screenshot_path else None,
             size=self.screenshot_size,
             inline=self.inline,
+            session=self.session,
         )
 
-        # Capture UI hierarchy
-        ui_dump_path = (
-            self.ui_dumps_dir
-            / f"{self.current_step:03d}-{description.lower().replace(' ', '-')[:30]}.json"
-        )
-        element_count = self._capture_ui_hierarchy(ui_dump_path)
+        # Capture UI hierarchy (overlaps with the screenshot's adb calls)
+        ui_future = self._pool.submit(self._capture_ui_hierarchy, ui_dump_path)
+
+        screenshot_result = screenshot_future.result()
+        element_count = ui_future.result()
 
         # Store step data
         step_data = {
-            "number": self.current_step,
+            "number": number,
             "description": description,
             "timestamp": step_time,
             "element_count": element_count,
@@ -145,10 +237,11 @@ class TestRecorder:
         if metadata:
             step_data["metadata"] = metadata
 
-        self.steps.append(step_data)
+        with self._steps_lock:
+            self.steps[slot] = step_data
 
         # Token-efficient output
-        print(f"  [{self.current_step}] {description} ({element_count} elements)")
+        print(f"  [{number}] {description} ({element_count} elements)")
 
     def _capture_ui_hierarchy(self, output_path: Path) -> int:
         """
@@ -161,34 +254,51 @@ class TestRecorder:
             Number of elements captured
         """
         try:
-            hierarchy = get_ui_hierarchy(self.serial)
+            hierarchy, element_count = self._parse_hierarchy(dump_ui_xml(self.serial))
 
             # Save to file
-            with open(output_path, "w") as f:
-                json.dump(hierarchy, f, indent=2)
+            json_utils.dump(hierarchy, output_path, indent=self.pretty)
 
-            # Count elements
-            element_count = self._count_elements(hierarchy)
             return element_count
 
         except Exception as e:
             print(f"  Warning: Failed to capture UI hierarchy: {e}")
             return 0
 
-    def _count_elements(self, node: dict) -> int:
+    @staticmethod
+    def _parse_hierarchy(xml_bytes: bytes) -> tuple:
         """
-        Recursively count elements in UI hierarchy.
+        Convert a uiautomator dump to its dict form and count its elements.
+
+        Builds the same {"tag", "attributes", "children"} structure as
+        device_utils.get_ui_hierarchy() in one iterparse pass, counting
+        nodes as they open, so no second walk over the tree is needed.
 
         Args:
-            node: UI hierarchy node
+            xml_bytes: Raw XML from uiautomator dump
 
         Returns:
-            Total element count
+            (hierarchy dict, element count) tuple
         """
-        count = 1
-        for child in node.get("children", []):
-            count += self._count_elements(child)
-        return count
+        root = None
+        stack = []
+        count = 0
+
+        for event, elem in ET.iterparse(BytesIO(xml_bytes), events=("start", "end")):
+            if event == "end":
+                stack.pop()
+                elem.clear()
+                continue
+
+            node = {"tag": elem.tag, "attributes": dict(elem.attrib), "children": []}
+            count += 1
+            if stack:
+                stack[-1]["children"].append(node)
+            else:
+                root = node
+            stack.append(node)
+
+        return root, count
 
     def finish(self, passed: bool = True) -> str:
         """
@@ -200,6 +310,13 @@ class TestRecorder:
         Returns:
             Summary string
         """
+        # Wait for deferred captures
+        if self._capture_queue is not None:
+            self._capture_queue.join()
+        with self._steps_lock:
+            # Drop steps whose deferred capture failed
+            self.steps = [step for step in self.steps if step is not None]
+
         total_time = time.time() - self.start_time
 
         # Generate test report
@@ -215,13 +332,15 @@ class TestRecorder:
 
         # Save report
         report_path = self.output_dir / "test-report.json"
-        with open(report_path, "w") as f:
-            json.dump(report, f, indent=2)
+        json_utils.dump(report, report_path, indent=self.pretty)
 
         # Generate markdown summary
         markdown_path = self.output_dir / "test-report.md"
         self._generate_markdown(markdown_path, report)
 
+        self._pool.shutdown()
+        self.session.close()
+
         # Token-efficient summary
         status = "✓ PASSED" if passed else "✗ FAILED"
         print(f"\n{status} in {total_time:.1f}s ({len(self.steps)} steps)")
@@ -233,38 +352,48 @@ class TestRecorder:
         """
         Generate markdown test report.
 
+        Pieces are written straight to the file as they are produced; the
+        report is never held in memory as a whole.
+
         Args:
             output_path: Path to save markdown
             report: Test report data
         """
-        lines = [
-            f"# Test Report: {report['test_name']}",
-            "",
-            f"**Status:** {'✓ PASSED' if report['passed'] else '✗ FAILED'}",
-            f"**Duration:** {report['duration_seconds']}s",
-            f"**Steps:** {len(report['steps'])}",
-            f"**Date:** {report['timestamp']}",
-            "",
-            "## Test Steps",
-            "",
-        ]
+        with open(output_path, "w", buffering=1 << 20) as f:
+            f.writelines(self._markdown_lines(report))
+
+    @staticmethod
+    def _markdown_lines(report: dict):
+        """
+        Yield the markdown test report line by line.
+
+        Args:
+            report: Test report data
+
+        Yields:
+            Report lines, each ending in a newline
+        """
+        yield f"# Test Report: {report['test_name']}\n"
+        yield "\n"
+        yield f"**Status:** {'✓ PASSED' if report['passed'] else '✗ FAILED'}\n"
+        yield f"**Duration:** {report['duration_seconds']}s\n"
+        yield f"**Steps:** {len(report['steps'])}\n"
+        yield f"**Date:** {report['timestamp']}\n"
+        yield "\n"
+        yield "## Test Steps\n"
 
         for step in report["steps"]:
-            lines.append(f"### Step {step['number']}: {step['description']}")
-            lines.append(f"**Time:** {step['timestamp']:.2f}s")
-            lines.append(f"**Elements:** {step['element_count']}")
+            yield "\n"
+            yield f"### Step {step['number']}: {step['description']}\n"
+            yield f"**Time:** {step['timestamp']:.2f}s\n"
+            yield f"**Elements:** {step['element_count']}\n"
 
             if "screenshot_name" in step:
-                lines.append(f"**Screenshot:** ![{step['description']}](screenshots/{step['screenshot_name']})")
+                yield f"**Screenshot:** ![{step['description']}](screenshots/{step['screenshot_name']})\n"
 
             if "assertion" in step:
                 symbol = "✓" if step.get("assertion_passed") else "✗"
-                lines.append(f"**Assertion:** {symbol} {step['assertion']}")
-
-            lines.append("")
-
-        with open(output_path, "w") as f:
-            f.write("\n".join(lines))
+                yield f"**Assertion:** {symbol} {step['assertion']}\n"
 
 
 def main():
@@ -307,6 +436,9 @@ Examples:
         help="Screenshot size (default: half)",
     )
     parser.add_argument("--app-name", help="App name for semantic naming")
+    parser.add_argument(
+        "--pretty", action="store_true", help="Write indented JSON artifacts (default: compact)"
+    )
 
     args = parser.parse_args()
 
@@ -318,6 +450,7 @@ Examples:
         inline=args.inline,
         screenshot_size=args.size,
         app_name=args.app_name,
+        pretty=args.pretty,
     )
 
     print("\nRecorder initialized. Use recorder.step() and recorder.finish() in your code.")